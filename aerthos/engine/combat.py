@@ -4,84 +4,150 @@ Combat system with THAC0 mechanics and dice rolling
 
 import random
 import re
-from typing import Dict, Optional, List
-from ..entities.character import Character
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterator, Optional, List, Tuple
+from ..entities.character import Character, SMALL_MEDIUM_SIZES
 from ..entities.player import Weapon
 
+# Dedicated generator for combat/dice rolls; getrandbits is bound once so
+# d20 and d6 rolls skip randint's argument handling
+_rng = random.Random()
+_getrandbits = _rng.getrandbits
 
-class DiceRoller:
-    """Handles all dice rolling operations"""
+# Dice notation: XdY+Z or XdY-Z or XdY or dY (assumes 1d if no number before d)
+_DICE_RE = re.compile(r'(\d*)d(\d+)([+\-]\d+)?')
 
-    @staticmethod
-    def roll(dice_string: str) -> int:
-        """
-        Parse and roll dice notation
-        Examples: '1d8', '2d6+1', '3d4-2', '1d12', '4+1'
 
-        Args:
-            dice_string: Dice notation string
+@lru_cache(maxsize=256)
+def _parse_dice(dice_string: str) -> Tuple[int, int, int]:
+    """
+    Parse dice notation into its components
 
-        Returns:
-            Total rolled value
-        """
-        dice_string = dice_string.strip().lower()
+    Parsing is cached, so a notation string that is rolled repeatedly is
+    only parsed once. The cache is bounded because notation can also come
+    from user input.
 
-        # Handle flat modifiers like "4+1" (hit dice)
-        if 'd' not in dice_string:
-            # It's just a flat number or number+modifier
-            if '+' in dice_string:
-                try:
-                    parts = dice_string.split('+')
-                    if len(parts) == 2:
-                        return int(parts[0]) + int(parts[1])
-                    else:
-                        raise ValueError(f"Invalid dice notation: {dice_string}")
-                except (ValueError, IndexError):
-                    raise ValueError(f"Invalid dice notation: {dice_string}")
-            elif '-' in dice_string:
+    Args:
+        dice_string: Dice notation string
+
+    Returns:
+        Tuple of (num_dice, die_size, modifier). Flat values such as '4+1'
+        parse to (0, 0, 5).
+    """
+    dice_string = dice_string.strip().lower()
+
+    # Handle flat modifiers like "4+1" (hit dice) with plain integer arithmetic
+    if 'd' not in dice_string:
+        for sign in '+-':
+            base, found, mod = dice_string.partition(sign)
+            if found:
                 try:
-                    parts = dice_string.split('-')
-                    if len(parts) == 2:
-                        return int(parts[0]) - int(parts[1])
-                    else:
-                        raise ValueError(f"Invalid dice notation: {dice_string}")
-                except (ValueError, IndexError):
+                    base, mod = int(base), int(mod)
+                except ValueError:
                     raise ValueError(f"Invalid dice notation: {dice_string}")
+                return 0, 0, (base + mod if sign == '+' else base - mod)
 
-            # Just a flat number
-            try:
-                return int(dice_string)
-            except ValueError:
-                raise ValueError(f"Invalid dice notation: {dice_string}")
+        # Just a flat number
+        try:
+            return 0, 0, int(dice_string)
+        except ValueError:
+            raise ValueError(f"Invalid dice notation: {dice_string}")
 
-        # Parse dice notation: XdY+Z or XdY-Z or XdY or dY (assumes 1d if no number before d)
-        match = re.match(r'(\d*)d(\d+)([+\-]\d+)?', dice_string)
+    # Parse dice notation
+    match = _DICE_RE.match(dice_string)
 
-        if not match:
-            raise ValueError(f"Invalid dice notation: {dice_string}")
+    if not match:
+        raise ValueError(f"Invalid dice notation: {dice_string}")
 
-        num_dice = int(match.group(1)) if match.group(1) else 1  # Default to 1 die
-        die_size = int(match.group(2))
-        modifier = int(match.group(3)) if match.group(3) else 0
+    num_dice = int(match.group(1)) if match.group(1) else 1  # Default to 1 die
+    die_size = int(match.group(2))
+    modifier = int(match.group(3)) if match.group(3) else 0
 
-        # Roll the dice
-        total = sum(random.randint(1, die_size) for _ in range(num_dice))
-        return total + modifier
+    return num_dice, die_size, modifier
 
-    @staticmethod
-    def roll_3d6() -> int:
-        """Roll 3d6 for ability scores"""
-        return sum(random.randint(1, 6) for _ in range(3))
 
-    @staticmethod
-    def roll_d20() -> int:
-        """Roll a d20"""
-        return random.randint(1, 20)
+def roll(dice_string: str) -> int:
+    """
+    Parse and roll dice notation
+    Examples: '1d8', '2d6+1', '3d4-2', '1d12', '4+1'
 
-    @staticmethod
-    def roll_d100() -> int:
-        """Roll d100 (percentile)"""
-        return random.randint(1, 100)
+    Args:
+        dice_string: Dice notation string
+
+    Returns:
+        Total rolled value
+    """
+    num_dice, die_size, modifier = _parse_dice(dice_string)
+
+    # Roll the dice (one and two dice cover nearly every weapon and monster)
+    randint = _rng.randint
+    if num_dice == 1:
+        return randint(1, die_size) + modifier
+    if num_dice == 2:
+        return randint(1, die_size) + randint(1, die_size) + modifier
+
+    # Larger pools (monster hit dice, treasure) are drawn in one C-level call
+    return sum(_rng.choices(range(1, die_size + 1), k=num_dice)) + modifier
+
+
+def roll_batch(die_size: int, count: int) -> List[int]:
+    """
+    Roll many dice of the same size in a single call
+
+    Used to pre-roll every d20 (or initiative die) a combat round needs
+    up front instead of calling randint once per attack.
+
+    Args:
+        die_size: Number of faces on the die
+        count: How many dice to roll
+
+    Returns:
+        List of individual die results
+    """
+    return _rng.choices(range(1, die_size + 1), k=count)
+
+
+def roll_3d6() -> int:
+    """Roll 3d6 for ability scores"""
+    total = 0
+    rolled = 0
+    while rolled < 3:
+        # 3 random bits give 0-7; reject 6 and 7 to keep the die fair
+        r = _getrandbits(3)
+        if r < 6:
+            total += r + 1
+            rolled += 1
+    return total
+
+
+def roll_d20() -> int:
+    """Roll a d20"""
+    while True:
+        # 5 random bits give 0-31; reject 20-31 to keep the die fair
+        r = _getrandbits(5)
+        if r < 20:
+            return r + 1
+
+
+def roll_d100() -> int:
+    """Roll d100 (percentile)"""
+    return _rng.randrange(100) + 1
+
+
+class DiceRoller:
+    """
+    Handles all dice rolling operations
+
+    The rolls are plain module functions; this class exposes them under the
+    DiceRoller name for existing callers and gives CombatResolver a
+    dice_roller attribute that tests can patch.
+    """
+
+    roll = staticmethod(roll)
+    roll_batch = staticmethod(roll_batch)
+    roll_3d6 = staticmethod(roll_3d6)
+    roll_d20 = staticmethod(roll_d20)
+    roll_d100 = staticmethod(roll_d100)
 
 
 class CombatResolver:
@@ -91,7 +157,8 @@ class CombatResolver:
         self.dice_roller = DiceRoller()
 
     def attack_roll(self, attacker: Character, defender: Character,
-                    weapon: Optional[Weapon] = None) -> Dict:
+                    weapon: Optional[Weapon] = None,
+                    roll: Optional[int] = None, narrate: bool = True) -> Dict:
         """
         Resolve a single attack using THAC0
 
@@ -101,88 +168,100 @@ class CombatResolver:
             attacker: The attacking character
             defender: The defending character
             weapon: Optional weapon being used (None = unarmed/default)
+            roll: Optional pre-rolled d20 result (rolled here if None)
+            narrate: Build the narrative text (None when False)
 
         Returns:
             Dict with: hit, roll, damage, narrative, defender_died
         """
 
         # Roll d20
-        roll = self.dice_roller.roll_d20()
+        if roll is None:
+            roll = self.dice_roller.roll_d20()
 
-        # Critical miss (natural 1)
-        if roll == 1:
-            return {
-                'hit': False,
-                'roll': 1,
-                'damage': 0,
-                'narrative': f"{attacker.name} fumbles the attack!",
-                'defender_died': False,
-                'critical': 'miss'
-            }
+        # Target number = THAC0 - defender's AC
+        # (Lower AC is better, so subtracting a low AC makes target number higher)
+        hit, damage, died, critical = self._resolve_attack(
+            attacker, defender, weapon, roll,
+            attacker.thac0 - defender.ac, attacker.get_to_hit_bonus()
+        )
+
+        narrative = None
+        if narrate:
+            narrative = self._narrate_attack(attacker, defender, hit, damage, died, critical)
+
+        return {
+            'hit': hit,
+            'roll': roll,
+            'damage': damage,
+            'narrative': narrative,
+            'defender_died': died,
+            'critical': critical
+        }
 
-        # Critical hit (natural 20)
-        if roll == 20:
-            damage = self._calculate_damage(attacker, defender, weapon, critical=True)
-            died = defender.take_damage(damage)
+    def _resolve_attack(self, attacker: Character, defender: Character,
+                        weapon: Optional[Weapon], roll: int, target_number: int,
+                        to_hit_bonus: int,
+                        damage_bonus: Optional[int] = None) -> Tuple[bool, int, bool, Optional[str]]:
+        """
+        Resolve the numeric part of an attack, without building any narrative
 
-            narrative = f"{attacker.name} scores a CRITICAL HIT on {defender.name} for {damage} damage!"
-            if died:
-                narrative += f" {defender.name} falls dead!"
+        Args:
+            attacker: The attacking character
+            defender: The defending character
+            weapon: Weapon being used (None = unarmed/default)
+            roll: The d20 result
+            target_number: Attacker's THAC0 minus defender's AC
+            to_hit_bonus: Attacker's STR to-hit bonus
+            damage_bonus: Attacker's STR damage bonus (looked up if None)
 
-            return {
-                'hit': True,
-                'roll': 20,
-                'damage': damage,
-                'narrative': narrative,
-                'defender_died': died,
-                'critical': 'hit'
-            }
+        Returns:
+            Tuple of (hit, damage, defender_died, critical)
+        """
 
-        # Normal THAC0 calculation
-        # Target number = THAC0 - defender's AC
-        # (Lower AC is better, so subtracting a low AC makes target number higher)
-        target_number = attacker.thac0 - defender.ac
+        # Critical miss (natural 1)
+        if roll == 1:
+            return False, 0, False, 'miss'
 
-        # Apply to-hit bonuses (STR modifier + weapon magic bonus)
-        to_hit_bonus = attacker.get_to_hit_bonus()
+        # Weapon magic bonus applies to both to-hit and damage; read it once
+        magic_bonus = getattr(weapon, 'magic_bonus', 0) if weapon else 0
+        critical = roll == 20
 
-        # Add weapon magic bonus if present
-        if weapon and hasattr(weapon, 'magic_bonus'):
-            to_hit_bonus += weapon.magic_bonus
+        # Critical hit (natural 20) always hits; otherwise normal THAC0 check
+        if not critical and roll + to_hit_bonus + magic_bonus < target_number:
+            return False, 0, False, None
 
-        adjusted_roll = roll + to_hit_bonus
+        damage = self._calculate_damage(attacker, defender, weapon, critical,
+                                        damage_bonus, magic_bonus)
+        return True, damage, defender.take_damage(damage), ('hit' if critical else None)
+
+    @staticmethod
+    def _narrate_attack(attacker: Character, defender: Character, hit: bool,
+                        damage: int, died: bool, critical: Optional[str]) -> str:
+        """Build the narrative line for a resolved attack"""
 
-        hit = adjusted_roll >= target_number
+        if critical == 'miss':
+            return f"{attacker.name} fumbles the attack!"
 
-        if hit:
-            damage = self._calculate_damage(attacker, defender, weapon)
-            died = defender.take_damage(damage)
+        if not hit:
+            return f"{attacker.name} misses {defender.name}."
 
+        if critical == 'hit':
+            narrative = f"{attacker.name} scores a CRITICAL HIT on {defender.name} for {damage} damage!"
+            if died:
+                narrative += f" {defender.name} falls dead!"
+        else:
             narrative = f"{attacker.name} hits {defender.name} for {damage} damage!"
             if died:
                 narrative += f" {defender.name} is slain!"
 
-            return {
-                'hit': True,
-                'roll': roll,
-                'damage': damage,
-                'narrative': narrative,
-                'defender_died': died,
-                'critical': None
-            }
-        else:
-            return {
-                'hit': False,
-                'roll': roll,
-                'damage': 0,
-                'narrative': f"{attacker.name} misses {defender.name}.",
-                'defender_died': False,
-                'critical': None
-            }
+        return narrative
 
     def _calculate_damage(self, attacker: Character, defender: Character,
                          weapon: Optional[Weapon] = None,
-                         critical: bool = False) -> int:
+                         critical: bool = False,
+                         damage_bonus: Optional[int] = None,
+                         magic_bonus: Optional[int] = None) -> int:
         """
         Calculate damage for an attack
 
@@ -191,6 +270,8 @@ class CombatResolver:
             defender: The defending character
             weapon: Weapon used (None = unarmed)
             critical: Whether this is a critical hit (double damage)
+            damage_bonus: Precomputed STR damage bonus (looked up if None)
+            magic_bonus: Precomputed weapon magic bonus (looked up if None)
 
         Returns:
             Total damage dealt
@@ -199,40 +280,37 @@ class CombatResolver:
         # Determine damage dice
         if weapon:
             # Use appropriate damage dice based on defender size
-            if defender.size in ['S', 'M']:
+            if defender.size in SMALL_MEDIUM_SIZES:
                 dice_string = weapon.damage_sm
             else:
                 dice_string = weapon.damage_l
         else:
             # Unarmed or natural weapon
-            # Check if attacker is a monster with damage property
-            if hasattr(attacker, 'damage'):
-                dice_string = attacker.damage
-            else:
-                # Default unarmed damage
-                dice_string = "1d2"
+            # Monsters carry a damage property; everyone else does 1d2 unarmed
+            dice_string = getattr(attacker, 'damage', "1d2")
 
         # Roll damage
         base_damage = self.dice_roller.roll(dice_string)
 
         # Add strength bonus
-        damage_bonus = attacker.get_damage_bonus()
+        if damage_bonus is None:
+            damage_bonus = attacker.get_damage_bonus()
 
         # Add weapon magic bonus to damage
-        if weapon and hasattr(weapon, 'magic_bonus'):
-            damage_bonus += weapon.magic_bonus
-
-        total_damage = base_damage + damage_bonus
+        if magic_bonus is None:
+            magic_bonus = getattr(weapon, 'magic_bonus', 0) if weapon else 0
+        damage_bonus += magic_bonus
 
-        # Critical hit doubles the total
-        if critical:
-            total_damage *= 2
+        # Critical hit doubles the total (a shift by the bool, no branch)
+        total_damage = (base_damage + damage_bonus) << critical
 
         # Minimum 1 damage on a hit
         return max(1, total_damage)
 
     def resolve_combat_round(self, party: List[Character],
-                            monsters: List[Character]) -> Dict:
+                            monsters: List[Character],
+                            narrate: bool = True,
+                            stats: Optional[Tuple[Dict, Dict]] = None) -> Dict:
         """
         Resolve a full combat round (side-based initiative)
 
@@ -241,77 +319,283 @@ class CombatResolver:
         Args:
             party: List of party members (PCs)
             monsters: List of monsters
+            narrate: Record action narratives (skipped when False)
+            stats: Optional (party, monster) snapshots from _snapshot_side,
+                   reused instead of re-extracting each side's stats
 
         Returns:
             Dict with round results
         """
 
         # Roll initiative (d6 for each side, lower goes first)
-        party_init = random.randint(1, 6)
-        monster_init = random.randint(1, 6)
+        party_init, monster_init = self.dice_roller.roll_batch(6, 2)
 
         results = {
             'party_initiative': party_init,
             'monster_initiative': monster_init,
             'actions': [],
+            'hits': 0,
+            'damage': 0,
             'party_won': False,
             'monsters_won': False
         }
 
-        # Determine order
+        # Snapshot both sides once; each is used as attacker and as defender
+        if stats is None:
+            stats = (self._snapshot_side(party), self._snapshot_side(monsters))
+        party_stats, monster_stats = stats
+
+        # Living defenders left for each outcome, decremented as kills land
+        defenders_left = {
+            'party_won': sum(1 for m in monsters if m.is_alive),
+            'monsters_won': sum(1 for p in party if p.is_alive)
+        }
+
+        # Determine order (party goes first on ties)
+        party_turn = (party, party_stats, monsters, monster_stats, 'party_won')
+        monster_turn = (monsters, monster_stats, party, party_stats, 'monsters_won')
         if party_init <= monster_init:
-            # Party goes first
-            self._process_side_actions(party, monsters, results['actions'])
-            if all(not m.is_alive for m in monsters):
-                results['party_won'] = True
-                return results
-
-            self._process_side_actions(monsters, party, results['actions'])
-            if all(not p.is_alive for p in party):
-                results['monsters_won'] = True
+            order = (party_turn, monster_turn)
         else:
-            # Monsters go first
-            self._process_side_actions(monsters, party, results['actions'])
-            if all(not p.is_alive for p in party):
-                results['monsters_won'] = True
-                return results
-
-            self._process_side_actions(party, monsters, results['actions'])
-            if all(not m.is_alive for m in monsters):
-                results['party_won'] = True
+            order = (monster_turn, party_turn)
+
+        for attackers, attacker_stats, defenders, defender_stats, outcome in order:
+            hits, damage, kills = self._process_side_actions(attackers, defenders,
+                                                             results['actions'], narrate,
+                                                             (attacker_stats, defender_stats))
+            results['hits'] += hits
+            results['damage'] += damage
+
+            defenders_left[outcome] -= kills
+            if defenders_left[outcome] <= 0:
+                results[outcome] = True
+                break
 
         return results
 
-    def _process_side_actions(self, attackers: List[Character],
-                              defenders: List[Character],
-                              action_log: List[str]):
+    def simulate(self, party: List[Character], monsters: List[Character],
+                 rounds: int) -> Dict:
         """
-        Process actions for one side in combat
+        Run combat rounds without narration (for balancing and AI simulation)
+
+        Stops early once either side is wiped out.
+
+        Args:
+            party: List of party members (PCs)
+            monsters: List of monsters
+            rounds: Maximum number of rounds to run
+
+        Returns:
+            Dict with: rounds, hits, damage, party_won, monsters_won
+        """
+
+        totals = {
+            'rounds': 0,
+            'hits': 0,
+            'damage': 0,
+            'party_won': False,
+            'monsters_won': False
+        }
+
+        run_round = self.specialize(party, monsters, narrate=False)
+
+        for _ in range(rounds):
+            result = run_round()
+            totals['rounds'] += 1
+            totals['hits'] += result['hits']
+            totals['damage'] += result['damage']
+
+            if result['party_won'] or result['monsters_won']:
+                totals['party_won'] = result['party_won']
+                totals['monsters_won'] = result['monsters_won']
+                break
+
+        return totals
+
+    def specialize(self, party: List[Character], monsters: List[Character],
+                   narrate: bool = True) -> Callable[[], Dict]:
+        """
+        Bind a round resolver to a fixed party/monster line-up
+
+        Both sides' combat stats are extracted once and baked into the
+        returned callable, so repeated rounds against the same encounter
+        (balance runs, simulations) skip that work. Stats are not refreshed,
+        so re-specialize if THAC0, AC or STR change between rounds.
+
+        Args:
+            party: List of party members (PCs)
+            monsters: List of monsters
+            narrate: Record action narratives (skipped when False)
+
+        Returns:
+            Zero-argument callable returning resolve_combat_round() results
+        """
+
+        stats = (self._snapshot_side(party), self._snapshot_side(monsters))
+        return partial(self.resolve_combat_round, party, monsters, narrate, stats)
+
+    def attack_rolls_batch(self, attackers: List[Character],
+                           defenders: List[Character],
+                           include_incapacitated: bool = False) -> List[Dict]:
+        """
+        Resolve one attack for every able attacker against a pool of defenders
+
+        All d20s for the side are rolled in one batch up front; each attacker
+        then picks a random living defender.
 
         Args:
             attackers: Characters taking action
-            defenders: Characters being targeted
-            action_log: List to append action narratives to
+            defenders: Pool of characters that can be targeted
+            include_incapacitated: Let sleeping/paralyzed attackers act too
+                (dead attackers never act)
+
+        Returns:
+            List of attack result dicts (see attack_roll), in attack order
         """
 
-        for attacker in attackers:
-            # Skip if incapacitated
-            if attacker.is_incapacitated():
-                continue
+        return [
+            {
+                'hit': hit,
+                'roll': roll,
+                'damage': damage,
+                'narrative': self._narrate_attack(attacker, target, hit, damage, died, critical),
+                'defender_died': died,
+                'critical': critical
+            }
+            for attacker, target, roll, hit, damage, died, critical
+            in self._iter_side_attacks(attackers, defenders,
+                                       include_incapacitated=include_incapacitated)
+        ]
+
+    def _iter_side_attacks(self, attackers: List[Character],
+                           defenders: List[Character],
+                           stats: Optional[Tuple[Dict, Dict]] = None,
+                           include_incapacitated: bool = False) -> Iterator[Tuple]:
+        """
+        Resolve a side's attacks one at a time
 
-            # Find a living target
-            living_defenders = [d for d in defenders if d.is_alive]
+        Yields plain tuples rather than result dicts so callers only pay for
+        the fields they use.
+
+        Args:
+            attackers: Characters taking action
+            defenders: Pool of characters that can be targeted
+            stats: Optional (attacker, defender) snapshots from _snapshot_side
+            include_incapacitated: Let sleeping/paralyzed attackers act too
+
+        Yields:
+            Tuple of (attacker, target, roll, hit, damage, defender_died, critical)
+        """
+
+        # Snapshot combat stats once so the loop reads plain int lists
+        if stats is None:
+            stats = (self._snapshot_side(attackers), self._snapshot_side(defenders))
+        attacker_stats, defender_stats = stats
+        thac0s = attacker_stats['thac0']
+        to_hits = attacker_stats['to_hit']
+        damage_bonuses = attacker_stats['damage_bonus']
+        acs = defender_stats['ac']
+
+        # Pre-roll every attacker's d20 for this side in one batch
+        rolls = self.dice_roller.roll_batch(20, len(attackers))
+
+        # Indices of living defenders, kept up to date as kills land, and
+        # each one's slot in that list so a kill is an O(1) swap-and-pop
+        living_defenders = [j for j, d in enumerate(defenders) if d.is_alive]
+        if not living_defenders:
+            return
+        living_slots = {j: k for k, j in enumerate(living_defenders)}
+
+        # Pre-draw every attacker's target in one call; a pick that has been
+        # slain earlier in the side is re-drawn from the survivors, which
+        # keeps each choice uniform over the defenders still standing
+        picks = _rng.choices(living_defenders, k=len(attackers))
+
+        for i, (attacker, roll) in enumerate(zip(attackers, rolls)):
             if not living_defenders:
                 break
 
-            # Pick a random target
-            target = random.choice(living_defenders)
+            # Skip if incapacitated (or only if dead, when told to)
+            if include_incapacitated:
+                if not attacker.is_alive:
+                    continue
+            elif attacker.is_incapacitated():
+                continue
+
+            # Pick a random living target
+            j = picks[i]
+            if not defenders[j].is_alive:
+                j = _rng.choice(living_defenders)
+            target = defenders[j]
 
             # Get weapon if attacker has equipment
-            weapon = None
-            if hasattr(attacker, 'equipment') and attacker.equipment.weapon:
-                weapon = attacker.equipment.weapon
+            equipment = getattr(attacker, 'equipment', None)
+            weapon = equipment.weapon if equipment else None
 
             # Make attack
-            result = self.attack_roll(attacker, target, weapon)
-            action_log.append(result['narrative'])
+            result = self._resolve_attack(
+                attacker, target, weapon, roll, thac0s[i] - acs[j], to_hits[i],
+                damage_bonuses[i]
+            )
+
+            # Drop a slain target from the pool (swap with last, then pop);
+            # pool order doesn't matter since targets are drawn at random
+            if result[2]:
+                k = living_slots.pop(j)
+                last = living_defenders.pop()
+                if last != j:
+                    living_defenders[k] = last
+                    living_slots[last] = k
+
+            yield (attacker, target, roll) + result
+
+    @staticmethod
+    def _snapshot_side(characters: List[Character]) -> Dict[str, List[int]]:
+        """
+        Extract one side's combat stats into parallel lists
+
+        Args:
+            characters: Characters on one side of the fight
+
+        Returns:
+            Dict of 'thac0', 'ac', 'to_hit' and 'damage_bonus' lists,
+            indexed like characters
+        """
+        return {
+            'thac0': [c.thac0 for c in characters],
+            'ac': [c.ac for c in characters],
+            'to_hit': [c.get_to_hit_bonus() for c in characters],
+            'damage_bonus': [c.get_damage_bonus() for c in characters]
+        }
+
+    def _process_side_actions(self, attackers: List[Character],
+                              defenders: List[Character],
+                              action_log: List[str],
+                              narrate: bool = True,
+                              stats: Optional[Tuple[Dict, Dict]] = None) -> Tuple[int, int, int]:
+        """
+        Process actions for one side in combat
+
+        Args:
+            attackers: Characters taking action
+            defenders: Characters being targeted
+            action_log: List to append action narratives to
+            narrate: Append narratives to action_log (skipped when False)
+            stats: Optional (attacker, defender) snapshots from _snapshot_side
+
+        Returns:
+            Tuple of (hits, total_damage, kills) for the side
+        """
+
+        hits = 0
+        total_damage = 0
+        kills = 0
+
+        for attacker, target, _, hit, damage, died, critical in self._iter_side_attacks(attackers, defenders, stats):
+            hits += hit
+            total_damage += damage
+            kills += died
+            if narrate:
+                action_log.append(self._narrate_attack(attacker, target, hit, damage, died, critical))
+
+        return hits, total_damage, kills
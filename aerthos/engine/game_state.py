@@ -2,62 +2,271 @@
 Central game state manager - coordinates all game systems
 """
 
+import copy
 import json
+import pickle
 import random
-from typing import Dict, List, Optional
+import re
+import tempfile
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-from ..entities.player import PlayerCharacter, Item, Weapon, Armor, LightSource, Spell
+from ..entities.player import PlayerCharacter, Item, Weapon, Armor, LightSource, Spell, BENEFICIAL_SPELL_KEYWORDS
 from ..entities.monster import Monster
+from ..entities.party import Party
 from ..world.dungeon import Dungeon
 from ..world.room import Room
 from ..world.encounter import EncounterManager, CombatEncounter, TrapEncounter, PuzzleEncounter
-from ..engine.combat import CombatResolver, DiceRoller
+from ..world.automap import AutoMap
+from ..engine.combat import CombatResolver, roll as roll_dice
 from ..engine.time_tracker import TimeTracker, RestSystem
 from ..systems.magic import MagicSystem
 from ..systems.skills import SkillResolver
 from ..systems.saving_throws import SavingThrowResolver
-from ..engine.parser import Command
+from ..engine.parser import Command, HELP_TEXT
+from ..ui.character_sheet import CharacterSheet
+from ..ui.save_system import SaveSystem
+
+
+# Monster condition by quarter of HP remaining (up to 25%, 50%, 75%, more)
+_HEALTH_LABELS = ('Near Death', 'Badly Wounded', 'Injured', 'Healthy')
+
+# Lock difficulty at which a thief's Open Locks chance is unmodified
+BASE_LOCK_DIFFICULTY = 30
+
+# Matches typed spell names that aren't memorized (see Spell.is_beneficial)
+_BENEFICIAL_SPELL_RE = re.compile('|'.join(BENEFICIAL_SPELL_KEYWORDS))
+
+# Words that appear in spell names and must not be mistaken for a target
+_SPELL_NAME_WORDS = frozenset({'cure', 'light', 'wounds', 'magic', 'missile', 'protection', 'evil', 'bless'})
+
+# Marks a search term with no cached partial match (a cached miss is None)
+_NOT_CACHED = object()
+
+
+def _load_json_cached(path: Path, use_cache: bool = True):
+    """
+    Load a JSON file, reusing a pickled copy while the file is unchanged
+
+    The parsed data is pickled to a '.cache' sidecar stamped with the JSON
+    file's mtime and size. An unreadable or stale cache is ignored, and a
+    read-only data directory just means nothing gets cached.
+
+    Args:
+        path: JSON file to load
+        use_cache: Read and write the sidecar cache
+
+    Returns:
+        Parsed JSON data
+    """
+
+    if not use_cache:
+        return json.loads(path.read_bytes())
+
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_path = path.with_name(path.name + '.cache')
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        # Missing, corrupt or foreign cache: fall back to the JSON and rebuild it
+        pass
+
+    data = json.loads(path.read_bytes())
+
+    # Write to a uniquely named file beside the cache and swap it in, so
+    # concurrent loaders never share a temp file and readers never see half
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, prefix=cache_path.name + '.',
+                                         suffix='.tmp', delete=False) as f:
+            tmp_path = Path(f.name)
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+    return data
 
 
 class GameData:
     """Holds all loaded game data"""
 
+    # JSON files under the data directory, each loaded into the same-named attribute
+    DATA_FILES = ('classes', 'races', 'monsters', 'items', 'spells')
+
+    # 'items' is a property over '_items' so replacing it resets the item caches
+    __slots__ = ('classes', 'races', 'monsters', '_items', 'spells',
+                 'item_index', 'item_search_terms', 'partial_item_matches',
+                 'item_prototypes', 'monster_templates')
+
     def __init__(self):
         self.classes = {}
         self.races = {}
         self.monsters = {}
-        self.items = {}
         self.spells = {}
 
+        # Sets up the item caches below (see the items setter)
+        self.items = {}
+
+        # Monster id -> static Monster constructor arguments
+        self.monster_templates: Dict[str, Dict] = {}
+
+    @property
+    def items(self) -> Dict[str, Dict]:
+        """Item definitions by key"""
+        return self._items
+
+    @items.setter
+    def items(self, items: Dict[str, Dict]):
+        self._items = items
+
+        # Normalized item key / display name -> item key
+        self.item_index: Dict[str, str] = {}
+
+        # (normalized key, normalized name, key) per item, for partial matches;
+        # None until built for the current item table
+        self.item_search_terms: Optional[List[Tuple[str, str, str]]] = None
+
+        # Search term -> item key found by the partial-match scan (hits only)
+        self.partial_item_matches: Dict[str, str] = {}
+
+        # Item key -> template instance, copied for each new item
+        self.item_prototypes: Dict[str, Item] = {}
+
     @classmethod
-    def load_all(cls, data_dir: str = "aerthos/data") -> 'GameData':
-        """Load all JSON game data"""
+    def load_all(cls, data_dir: str = "aerthos/data", use_cache: bool = True) -> 'GameData':
+        """
+        Load all JSON game data
+
+        Args:
+            data_dir: Directory holding the JSON data files
+            use_cache: Reuse pickled copies of unchanged files (see _load_json_cached)
+
+        Returns:
+            Loaded GameData
+        """
 
         data = cls()
 
-        # Load JSON files
-        with open(f"{data_dir}/classes.json") as f:
-            data.classes = json.load(f)
+        for name in cls.DATA_FILES:
+            path = Path(data_dir) / f"{name}.json"
+            setattr(data, name, _load_json_cached(path, use_cache))
 
-        with open(f"{data_dir}/races.json") as f:
-            data.races = json.load(f)
+        data.build_item_index()
 
-        with open(f"{data_dir}/monsters.json") as f:
-            data.monsters = json.load(f)
+        return data
 
-        with open(f"{data_dir}/items.json") as f:
-            data.items = json.load(f)
+    def build_item_index(self):
+        """Index item keys by normalized key and display name (drops cached lookups and prototypes)"""
 
-        with open(f"{data_dir}/spells.json") as f:
-            data.spells = json.load(f)
+        index = {}
+        search_terms = []
+        for key, item_data in self.items.items():
+            key_norm = key.casefold().replace('_', ' ')
+            name_norm = item_data['name'].casefold()
 
-        return data
+            # First definition wins if two items normalize to the same name
+            index.setdefault(key_norm, key)
+            index.setdefault(name_norm, key)
+            search_terms.append((key_norm, name_norm, key))
+
+        self.item_index = index
+        self.item_search_terms = search_terms
+        self.partial_item_matches = {}
+        self.item_prototypes = {}
+
+    def find_item_key(self, item_name: str) -> Optional[str]:
+        """
+        Find the item key for a key or display name
+
+        Exact key and exact normalized key/name matches are dict lookups;
+        only a miss on both falls back to a substring scan.
+
+        Args:
+            item_name: Item key or display name (case-insensitive)
+
+        Returns:
+            Item key, or None if nothing matches
+        """
+
+        if item_name in self.items:
+            return item_name
+
+        # Index is built by load_all() and reset when items is replaced; build
+        # it here for a new table or one that gained/lost entries in place
+        # (call build_item_index() after editing existing entries in place)
+        if self.item_search_terms is None or len(self.item_search_terms) != len(self.items):
+            self.build_item_index()
+
+        search_lower = item_name.casefold().replace('_', ' ')
+
+        key = self.item_index.get(search_lower)
+        if key:
+            return key
+
+        # Try partial match on key or display name; results, misses included,
+        # are remembered so a repeated partial or unknown name costs one dict lookup
+        key = self.partial_item_matches.get(search_lower, _NOT_CACHED)
+        if key is not _NOT_CACHED:
+            return key
+
+        key = next((key for key_norm, name_norm, key in self.item_search_terms
+                    if search_lower in key_norm or search_lower in name_norm), None)
+        self.partial_item_matches[search_lower] = key
+
+        return key
 
 
 class GameState:
     """Central game state manager"""
 
+    # Command action -> handler method name, built once per class
+    _HANDLER_NAMES = MappingProxyType({
+        'move': '_handle_move',
+        'attack': '_handle_attack',
+        'take': '_handle_take',
+        'drop': '_handle_drop',
+        'use': '_handle_use',
+        'equip': '_handle_equip',
+        'cast': '_handle_cast',
+        'look': '_handle_look',
+        'search': '_handle_search',
+        'open': '_handle_open',
+        'rest': '_handle_rest',
+        'inventory': '_handle_inventory',
+        'status': '_handle_status',
+        'spells': '_handle_spells',
+        'memorize': '_handle_memorize',
+        'map': '_handle_map',
+        'directions': '_handle_directions',
+        'help': '_handle_help',
+        'save': '_handle_save',
+        'load': '_handle_load',
+        'quit': '_handle_quit'
+    })
+
+    # Equippable item class -> (PlayerCharacter method, success message)
+    _EQUIP_ACTIONS = MappingProxyType({
+        Weapon: ('equip_weapon', "You equip the {}."),
+        Armor: ('equip_armor', "You equip the {}."),
+        LightSource: ('equip_light', "You light the {}.")
+    })
+
+    __slots__ = (
+        'player', 'dungeon', 'current_room', 'is_active',
+        'combat_resolver', 'time_tracker', 'rest_system', 'magic_system',
+        'skill_resolver', 'save_resolver', 'encounter_manager', 'automap',
+        '_active_monsters', '_monster_names', 'in_combat', 'current_encounter',
+        'game_data', 'party'
+    )
+
     def __init__(self, player: PlayerCharacter, dungeon: Dungeon):
         self.player = player
         self.dungeon = dungeon
@@ -72,15 +281,32 @@ class GameState:
         self.skill_resolver = SkillResolver()
         self.save_resolver = SavingThrowResolver()
         self.encounter_manager = EncounterManager()
+        self.automap = AutoMap()  # Keeps room layout between 'map' commands
 
         # Combat state
-        self.active_monsters: List[Monster] = []
+        self.active_monsters = []
         self.in_combat = False
         self.current_encounter: Optional[CombatEncounter] = None
 
         # Game data
         self.game_data: Optional[GameData] = None
 
+        # Attached by the CLI/web front ends for party play
+        self.party: Optional[Party] = None
+
+    @property
+    def active_monsters(self) -> List[Monster]:
+        """Monsters in the current fight, in status-display order"""
+        return self._active_monsters
+
+    @active_monsters.setter
+    def active_monsters(self, monsters: List[Monster]):
+        self._active_monsters = monsters
+
+        # Lowercased names, parallel to active_monsters, for attack targeting;
+        # rebuilt whenever the list is replaced, trimmed by _remove_monster()
+        self._monster_names: List[str] = [m.name.lower() for m in monsters]
+
     def load_game_data(self, data_dir: str = "aerthos/data"):
         """Load all game data"""
         self.game_data = GameData.load_all(data_dir)
@@ -97,33 +323,9 @@ class GameState:
         """
 
         # Route to appropriate handler
-        handlers = {
-            'move': self._handle_move,
-            'attack': self._handle_attack,
-            'take': self._handle_take,
-            'drop': self._handle_drop,
-            'use': self._handle_use,
-            'equip': self._handle_equip,
-            'cast': self._handle_cast,
-            'look': self._handle_look,
-            'search': self._handle_search,
-            'open': self._handle_open,
-            'rest': self._handle_rest,
-            'inventory': self._handle_inventory,
-            'status': self._handle_status,
-            'spells': self._handle_spells,
-            'memorize': self._handle_memorize,
-            'map': self._handle_map,
-            'directions': self._handle_directions,
-            'help': self._handle_help,
-            'save': self._handle_save,
-            'load': self._handle_load,
-            'quit': self._handle_quit
-        }
-
-        handler = handlers.get(command.action)
-        if handler:
-            return handler(command)
+        handler_name = self._HANDLER_NAMES.get(command.action)
+        if handler_name:
+            return getattr(self, handler_name)(command)
         else:
             return {'success': False, 'message': "I don't understand that command. Type 'help' for options."}
 
@@ -154,12 +356,12 @@ class GameState:
         # Check for encounters
         encounter_msg = self._check_encounters('on_enter')
 
-        messages = [room_desc]
         if encounter_msg:
-            messages.append(encounter_msg)
-        messages.extend(time_messages)
+            parts = (room_desc, encounter_msg, *time_messages)
+        else:
+            parts = (room_desc, *time_messages)
 
-        return {'success': True, 'message': '\n\n'.join(messages)}
+        return {'success': True, 'message': '\n\n'.join(parts)}
 
     def _handle_attack(self, command: Command) -> Dict:
         """Handle combat"""
@@ -172,10 +374,9 @@ class GameState:
 
         target = None
         if target_name:
-            for monster in self.active_monsters:
-                if target_name.lower() in monster.name.lower():
-                    target = monster
-                    break
+            target_lower = target_name.lower()
+            target = next((m for m, name in zip(self.active_monsters, self._monster_names)
+                           if target_lower in name), None)
         else:
             # Attack first living monster
             target = next((m for m in self.active_monsters if m.is_alive), None)
@@ -186,18 +387,19 @@ class GameState:
         # Player attacks
         weapon = self.player.equipment.weapon
 
+        # Every path below adds to this one list; it is joined once at the end
+        messages = []
+        success = True
+        victory = False
+
         # Check for weapon restrictions
         weapon_penalty = 0
         if weapon:
             can_use, restriction_msg = self.player.can_use_weapon(weapon)
             if not can_use:
                 weapon_penalty = -4  # Severe penalty for using improper weapon
-                messages = [f"⚠️  {restriction_msg}"]
+                messages.append(f"⚠️  {restriction_msg}")
                 messages.append(f"You struggle with the unfamiliar weapon! (-4 to hit)")
-            else:
-                messages = []
-        else:
-            messages = []
 
         # Temporarily modify THAC0 for weapon restriction penalty
         original_thac0 = self.player.thac0
@@ -214,29 +416,12 @@ class GameState:
 
         # Check if target died
         if result['defender_died']:
-            self.active_monsters.remove(target)
-
-            # Award XP to party or player
-            if hasattr(self, 'party') and self.party:
-                living_members = self.party.get_living_members()
-                if living_members:
-                    xp_per_member = target.xp_value // len(living_members)
-                    for member in living_members:
-                        level_up_msg = member.gain_xp(xp_per_member)
-                        if level_up_msg:
-                            messages.append(f"{member.name}: {level_up_msg}")
-                    messages.append(f"Party gains {target.xp_value} XP! ({xp_per_member} each)")
-                else:
-                    # Party wiped out - no XP awarded
-                    messages.append(f"The party has fallen! No XP awarded.")
-            else:
-                level_up_msg = self.player.gain_xp(target.xp_value)
-                messages.append(f"You gain {target.xp_value} XP!")
-                if level_up_msg:
-                    messages.append(level_up_msg)
+            self._remove_monster(target)
+            self._award_kill_xp([target], messages)
 
-            # Check if combat over
-            if not any(m.is_alive for m in self.active_monsters):
+            # Check if combat over (slain monsters are removed as they fall)
+            if not self.active_monsters:
+                victory = True
                 self.in_combat = False
                 messages.append("\n═══ VICTORY ═══")
 
@@ -247,28 +432,45 @@ class GameState:
                         messages.append(treasure_msg)
 
                 self.current_encounter = None  # Clear current encounter
-                return {'success': True, 'message': '\n'.join(messages)}
 
-        # Monsters counter-attack
-        for monster in self.active_monsters:
-            if monster.is_alive:
-                monster_result = self.combat_resolver.attack_roll(monster, self.player)
-                messages.append(monster_result['narrative'])
+        if not victory:
+            success = self._monsters_counter_attack(messages)
 
-                if monster_result['defender_died']:
-                    messages.append("\n═══ YOU HAVE DIED ═══")
-                    self.is_active = False
-                    return {'success': False, 'message': '\n'.join(messages)}
+            if success:
+                # Player survived the round: show monster status
+                if self.in_combat and self.active_monsters:
+                    messages.append(self._format_monster_status())
 
-        # Show monster status after combat round
-        if self.in_combat and self.active_monsters:
-            messages.append(self._format_monster_status())
+                # Advance time (combat takes time)
+                messages.extend(self.time_tracker.advance_turn(self.player))
 
-        # Advance time (combat takes time)
-        time_messages = self.time_tracker.advance_turn(self.player)
-        messages.extend(time_messages)
+        return {'success': success, 'message': '\n'.join(messages)}
 
-        return {'success': True, 'message': '\n'.join(messages)}
+    def _monsters_counter_attack(self, messages: List[str]) -> bool:
+        """
+        Let every living monster strike back at the player
+
+        Args:
+            messages: Message list to append attack narratives to
+
+        Returns:
+            True if the player survived
+        """
+
+        # One batched pass: all d20s rolled up front, stops once the player falls.
+        # Every living monster strikes, even one that is asleep or paralyzed.
+        counter_attacks = self.combat_resolver.attack_rolls_batch(
+            self.active_monsters, [self.player], include_incapacitated=True
+        )
+        for monster_result in counter_attacks:
+            messages.append(monster_result['narrative'])
+
+            if monster_result['defender_died']:
+                messages.append("\n═══ YOU HAVE DIED ═══")
+                self.is_active = False
+                return False
+
+        return True
 
     def _handle_take(self, command: Command) -> Dict:
         """Handle taking items"""
@@ -362,12 +564,12 @@ class GameState:
 
         # Handle consumables
         if item.item_type == 'consumable':
-            if 'healing' in item.properties:
-                healing = DiceRoller.roll(item.properties['healing'])
+            if item.use_kind == 'potion':
+                healing = roll_dice(item.properties['healing'])
                 self.player.heal(healing)
                 self.player.inventory.remove_item(item.name)
                 return {'success': True, 'message': f"You drink the potion and heal {healing} HP!"}
-            elif item.name.lower().find('ration') != -1:
+            elif item.use_kind == 'ration':
                 # Rations should be eaten during rest, not used directly
                 return {'success': False, 'message': "Rations are food for resting. Use the 'rest' command to eat and recover."}
             else:
@@ -386,20 +588,17 @@ class GameState:
         if not item:
             return {'success': False, 'message': f"You don't have {command.target}."}
 
-        if isinstance(item, Weapon):
+        equip_action = self._EQUIP_ACTIONS.get(type(item))
+        if equip_action:
             # Check class weapon restrictions
-            can_use, restriction_msg = self.player.can_use_weapon(item)
-            if not can_use:
-                return {'success': False, 'message': restriction_msg}
-
-            self.player.equip_weapon(item)
-            return {'success': True, 'message': f"You equip the {item.name}."}
-        elif isinstance(item, Armor):
-            self.player.equip_armor(item)
-            return {'success': True, 'message': f"You equip the {item.name}."}
-        elif isinstance(item, LightSource):
-            self.player.equip_light(item)
-            return {'success': True, 'message': f"You light the {item.name}."}
+            if item.item_type == 'weapon':
+                can_use, restriction_msg = self.player.can_use_weapon(item)
+                if not can_use:
+                    return {'success': False, 'message': restriction_msg}
+
+            method_name, message = equip_action
+            getattr(self.player, method_name)(item)
+            return {'success': True, 'message': message.format(item.name)}
         elif item.item_type == 'light_source':
             # Fallback for generic Item objects that are light sources
             # Convert to proper LightSource object
@@ -439,29 +638,29 @@ class GameState:
         # If no preposition found, check if last word is a party member name (for beneficial spells)
         if not target_name:
             parts = full_command.split()
-            if len(parts) > 1 and hasattr(self, 'party') and self.party:
+            if len(parts) > 1 and self.party:
                 potential_target = parts[-1]
                 # Check if it matches a party member - but be careful not to match spell words
                 # Only match if the name is reasonably unique (at least 3 chars and not a common spell word)
                 if len(potential_target) >= 3:
-                    spell_words = ['cure', 'light', 'wounds', 'magic', 'missile', 'protection', 'evil', 'bless']
-                    if potential_target.lower() not in spell_words:
-                        for member in self.party.members:
-                            if potential_target.lower() in member.name.lower():
-                                target_name = potential_target
-                                spell_name = ' '.join(parts[:-1])
-                                break
-
-        # Determine if this is a beneficial spell (healing/buff) or harmful spell
-        # Support abbreviated spell names (e.g., "c" for "cure")
-        spell_name_lower = spell_name.lower()
-        beneficial_spells = ['cure', 'heal', 'bless', 'protection', 'shield', 'aid']
-
-        # Check both directions: "cure" in "cure light wounds" OR "c" in "cure"
-        is_beneficial = any(
-            keyword in spell_name_lower or spell_name_lower in keyword
-            for keyword in beneficial_spells
-        )
+                    if potential_target.lower() not in _SPELL_NAME_WORDS:
+                        if self.party.get_member_by_name(potential_target):
+                            target_name = potential_target
+                            spell_name = ' '.join(parts[:-1])
+
+        # Determine if this is a beneficial spell (healing/buff) or harmful spell.
+        # The memorized spell that would be cast is tagged when it's created.
+        memorized_spell = self.player.find_memorized_spell(spell_name)
+        if memorized_spell:
+            is_beneficial = memorized_spell.is_beneficial
+        else:
+            # Support abbreviated spell names (e.g., "c" for "cure")
+            spell_name_lower = spell_name.lower()
+
+            # Check both directions: "cure" in "cure light wounds" OR "c" in "cure"
+            is_beneficial = bool(_BENEFICIAL_SPELL_RE.search(spell_name_lower)) or any(
+                spell_name_lower in keyword for keyword in BENEFICIAL_SPELL_KEYWORDS
+            )
 
         # DEBUG: Log spell detection
         print(f"[DEBUG] Spell: '{spell_name}', Target: '{target_name}', Beneficial: {is_beneficial}")
@@ -470,17 +669,13 @@ class GameState:
         if is_beneficial:
             # Beneficial spells should ONLY target party members (or caster if no target specified)
             # They should NEVER target monsters, even in combat
-            if target_name and hasattr(self, 'party') and self.party:
+            if target_name and self.party:
                 # Find party member by name
                 print(f"[DEBUG] Looking for party member matching '{target_name}'")
                 print(f"[DEBUG] Party members: {[m.name for m in self.party.members]}")
-                target_char = None
-                for member in self.party.members:
-                    if target_name.lower() in member.name.lower():
-                        target_char = member
-                        print(f"[DEBUG] Found match: {member.name}")
-                        break
+                target_char = self.party.get_member_by_name(target_name)
                 if target_char:
+                    print(f"[DEBUG] Found match: {target_char.name}")
                     targets = [target_char]
                 else:
                     return {'success': False, 'message': f"No party member named '{target_name}' found."}
@@ -505,29 +700,11 @@ class GameState:
         if not is_beneficial and self.active_monsters:
             dead_monsters = [m for m in self.active_monsters if not m.is_alive]
             for monster in dead_monsters:
-                self.active_monsters.remove(monster)
-
-                # Award XP to party or player
-                if hasattr(self, 'party') and self.party:
-                    living_members = self.party.get_living_members()
-                    if living_members:
-                        xp_per_member = monster.xp_value // len(living_members)
-                        for member in living_members:
-                            level_up_msg = member.gain_xp(xp_per_member)
-                            if level_up_msg:
-                                messages.append(f"{member.name}: {level_up_msg}")
-                        messages.append(f"Party gains {monster.xp_value} XP! ({xp_per_member} each)")
-                    else:
-                        # Party wiped out - no XP awarded
-                        messages.append(f"The party has fallen! No XP awarded.")
-                else:
-                    level_up_msg = self.player.gain_xp(monster.xp_value)
-                    messages.append(f"You gain {monster.xp_value} XP!")
-                    if level_up_msg:
-                        messages.append(level_up_msg)
+                self._remove_monster(monster)
+            self._award_kill_xp(dead_monsters, messages)
 
             # Check if combat is over
-            if not any(m.is_alive for m in self.active_monsters):
+            if not self.active_monsters:
                 self.in_combat = False
                 messages.append("\n═══ VICTORY ═══")
 
@@ -592,40 +769,38 @@ class GameState:
     def _handle_open(self, command: Command) -> Dict:
         """Handle opening locked containers"""
 
-        # Get encounters for this room
-        room_encounters = self.dungeon.get_room_encounters(self.current_room.id)
-
-        # Look for puzzle encounters (locked chests)
-        locked_chest = None
-        encounter_id = None
-        for i, enc_data in enumerate(room_encounters):
-            if enc_data.get('type') == 'puzzle' and enc_data.get('puzzle_type') == 'locked_chest':
-                encounter_id = f"{self.current_room.id}_puzzle_{i}"
-                # Check if already completed
-                if encounter_id not in self.current_room.encounters_completed:
-                    locked_chest = enc_data
-                    break
+        # Look for puzzle encounters (locked chests); the scan is done once per room
+        room = self.current_room
+        if room.locked_chests is None:
+            room.locked_chests = [
+                (f"{room.id}_puzzle_{i}", enc_data,
+                 enc_data.get('difficulty', BASE_LOCK_DIFFICULTY) - BASE_LOCK_DIFFICULTY)
+                for i, enc_data in enumerate(self.dungeon.get_room_encounters(room.id))
+                if enc_data.get('type') == 'puzzle' and enc_data.get('puzzle_type') == 'locked_chest'
+            ]
+
+        encounter_id, locked_chest, lock_penalty = next(
+            (chest for chest in room.locked_chests if chest[0] not in room.encounters_completed),
+            (None, None, 0)
+        )
 
         if not locked_chest:
             # Check if already opened
-            if encounter_id and encounter_id in self.current_room.encounters_completed:
+            if room.locked_chests:
                 return {'success': False, 'message': "The chest is already open and empty."}
             else:
                 return {'success': False, 'message': "There's nothing here to open."}
 
-        # Get difficulty
-        difficulty = locked_chest.get('difficulty', 30)
-
         # Check if player is a thief with lockpicking skills
         if self.player.char_class == 'Thief' and hasattr(self.player, 'thief_skills'):
             # Thief can attempt to pick the lock
             open_locks_skill = self.player.thief_skills.get('open_locks', 0)
 
             # Roll percentile dice
-            roll = DiceRoller.roll('1d100')
+            roll = roll_dice('1d100')
 
-            # Adjust roll by difficulty
-            success_chance = open_locks_skill - (difficulty - 30)  # Base 30 difficulty = no modifier
+            # Adjust chance by the lock's difficulty
+            success_chance = open_locks_skill - lock_penalty
 
             messages = []
             messages.append(f"You carefully examine the lock and work your picks...")
@@ -636,19 +811,18 @@ class GameState:
                 messages.append("\n🔓 Click! The lock opens!")
 
                 # Mark encounter as completed
-                self.current_room.encounters_completed.append(encounter_id)
+                self.current_room.mark_encounter_completed(encounter_id)
 
                 # Give reward
                 reward_id = locked_chest.get('reward')
                 if reward_id == 'treasure_chest_1':
                     # Treasure chest reward
-                    gold_found = 100 + DiceRoller.roll('3d20')
+                    gold_found = 100 + roll_dice('3d20')
                     self.player.gold += gold_found
                     messages.append(f"\nInside the chest you find {gold_found} gold pieces!")
 
                     # Maybe add a random item
-                    if DiceRoller.roll('1d6') >= 4:
-                        from ..entities.player import Item
+                    if roll_dice('1d6') >= 4:
                         potion = Item(name="Potion of Healing", item_type="potion", weight=0.5,
                                     properties={'healing': '2d4+2'})
                         self.player.inventory.add_item(potion)
@@ -671,12 +845,8 @@ class GameState:
         # If rest is successful, advance time by 8 hours (48 turns)
         if result['success']:
             messages = [result['narrative']]
-            # Advance 48 turns (8 hours)
-            for _ in range(48):
-                time_messages = self.time_tracker.advance_turn(self.player)
-                # Only show final time message, not all 48
-                if time_messages and _ == 47:
-                    messages.extend(time_messages)
+            # Advance 48 turns (8 hours); only the final turn's messages are shown
+            messages.extend(self.time_tracker.advance_turns(self.player, 48))
             return {'success': True, 'message': '\n'.join(messages)}
 
         return {'success': result['success'], 'message': result['narrative']}
@@ -687,29 +857,25 @@ class GameState:
         if not self.player.inventory.items:
             return {'success': True, 'message': "Your inventory is empty."}
 
-        # Get equipped items for comparison
-        equipped_weapon = self.player.equipment.weapon
-        equipped_armor = self.player.equipment.armor
-        equipped_shield = self.player.equipment.shield
-        equipped_light = self.player.equipment.light_source
+        # Equipped markers keyed by object identity; later slots take
+        # precedence (weapon > armor > shield > light) if one item fills two
+        equipment = self.player.equipment
+        markers = {}
+        if equipment.light_source:
+            markers[id(equipment.light_source)] = (
+                f" [EQUIPPED - LIGHT: {equipment.light_source.turns_remaining} turns left]"
+            )
+        for equipped, slot in ((equipment.shield, 'SHIELD'),
+                               (equipment.armor, 'ARMOR'),
+                               (equipment.weapon, 'WEAPON')):
+            if equipped:
+                markers[id(equipped)] = f" [EQUIPPED - {slot}]"
 
         # Build item list with equipped markers
-        item_lines = []
-        for item in self.player.inventory.items:
-            marker = ""
-            if equipped_weapon and item.name == equipped_weapon.name and id(item) == id(equipped_weapon):
-                marker = " [EQUIPPED - WEAPON]"
-            elif equipped_armor and item.name == equipped_armor.name and id(item) == id(equipped_armor):
-                marker = " [EQUIPPED - ARMOR]"
-            elif equipped_shield and item.name == equipped_shield.name and id(item) == id(equipped_shield):
-                marker = " [EQUIPPED - SHIELD]"
-            elif equipped_light and item.name == equipped_light.name and id(item) == id(equipped_light):
-                turns_left = equipped_light.turns_remaining
-                marker = f" [EQUIPPED - LIGHT: {turns_left} turns left]"
-
-            item_lines.append(f"  - {item.name} ({item.weight} lbs){marker}")
-
-        items_text = '\n'.join(item_lines)
+        items_text = '\n'.join(
+            f"  - {item.name} ({item.weight} lbs){markers.get(id(item), '')}"
+            for item in self.player.inventory.items
+        )
         weight = self.player.inventory.current_weight
         max_weight = self.player.inventory.max_weight
 
@@ -723,7 +889,6 @@ class GameState:
     def _handle_status(self, command: Command) -> Dict:
         """Show character status"""
 
-        from ..ui.character_sheet import CharacterSheet
         sheet = CharacterSheet.format_character(self.player)
         return {'success': True, 'message': sheet}
 
@@ -764,12 +929,7 @@ class GameState:
 
         # Find the spell in known spells
         spell_name = command.target
-        found_spell = None
-
-        for spell in self.player.spells_known:
-            if spell_name.lower() in spell.name.lower():
-                found_spell = spell
-                break
+        found_spell = self.player.find_known_spell(spell_name)
 
         if not found_spell:
             return {'success': False, 'message': f"You don't know a spell called '{spell_name}'."}
@@ -793,9 +953,7 @@ class GameState:
     def _handle_map(self, command: Command) -> Dict:
         """Show auto-map"""
 
-        from ..world.automap import AutoMap
-        automap = AutoMap()
-        map_str = automap.generate_map(self.current_room.id, self.dungeon)
+        map_str = self.automap.generate_map(self.current_room.id, self.dungeon)
         return {'success': True, 'message': map_str}
 
     def _handle_directions(self, command: Command) -> Dict:
@@ -804,14 +962,9 @@ class GameState:
         if not self.current_room.exits:
             return {'success': True, 'message': "There are no obvious exits from here. You may be trapped!"}
 
-        # Build formatted list of exits
-        exits_list = []
-        for direction in ['north', 'south', 'east', 'west', 'up', 'down']:
-            if direction in self.current_room.exits:
-                exits_list.append(direction.capitalize())
-
-        if exits_list:
-            msg = "Available exits: " + ", ".join(exits_list)
+        exits_display = self.current_room.exits_display
+        if exits_display:
+            msg = "Available exits: " + ", ".join(exits_display)
         else:
             msg = "There are no obvious exits from here."
 
@@ -820,36 +973,31 @@ class GameState:
     def _handle_help(self, command: Command) -> Dict:
         """Show help"""
 
-        from ..engine.parser import CommandParser
-        parser = CommandParser()
-        return {'success': True, 'message': parser.get_help_text()}
+        return {'success': True, 'message': HELP_TEXT}
 
     def _handle_save(self, command: Command) -> Dict:
         """Save game"""
 
-        from ..ui.save_system import SaveSystem
         save_system = SaveSystem()
 
         # Show existing saves
         saves = save_system.list_saves()
+        occupied_slots = {save['slot'] for save in saves}
 
-        print("\n" + "═" * 70)
-        print("SAVE GAME")
-        print("═" * 70)
-        print()
+        # Build the whole menu and print it in one write
+        lines = ["\n" + "═" * 70, "SAVE GAME", "═" * 70, ""]
 
         if saves:
-            print("Existing saves:")
+            lines.append("Existing saves:")
             for save in saves:
-                print(f"  Slot {save['slot']}: {save['character_name']} - Level {save['level']} {save['class']}")
+                lines.append(f"  Slot {save['slot']}: {save['character_name']} - Level {save['level']} {save['class']}")
                 if save.get('description'):
-                    print(f"    Description: {save['description']}")
-                print(f"    Saved: {save['timestamp']}")
-            print()
+                    lines.append(f"    Description: {save['description']}")
+                lines.append(f"    Saved: {save['timestamp']}")
+            lines.append("")
 
-        print("Available slots: 1, 2, 3")
-        print("0. Cancel")
-        print()
+        lines.extend(("Available slots: 1, 2, 3", "0. Cancel", ""))
+        print('\n'.join(lines))
 
         while True:
             try:
@@ -861,9 +1009,7 @@ class GameState:
                 slot = int(choice)
                 if 1 <= slot <= 3:
                     # Check if slot has existing save
-                    slot_occupied = any(s['slot'] == slot for s in saves)
-
-                    if slot_occupied:
+                    if slot in occupied_slots:
                         confirm = input(f"Slot {slot} already has a save. Overwrite? (y/n): ").strip().lower()
                         if confirm not in ['y', 'yes']:
                             continue
@@ -872,7 +1018,10 @@ class GameState:
                     print()
                     description = input("Save description (optional, press Enter to skip): ").strip()
 
-                    save_system.save_game(self, slot, description)
+                    try:
+                        save_system.save_game(self, slot, description)
+                    except OSError as e:
+                        return {'success': False, 'message': f"Could not save to slot {slot}: {e}"}
                     return {'success': True, 'message': f"Game saved to slot {slot}!"}
                 else:
                     print("Invalid slot. Please choose 1, 2, or 3.")
@@ -895,16 +1044,21 @@ class GameState:
     def _check_encounters(self, trigger_type: str) -> Optional[str]:
         """Check for and trigger encounters"""
 
-        # Get encounter data from dungeon
-        room_encounter_data = self.dungeon.get_room_encounters(self.current_room.id)
+        room = self.current_room
 
-        # Load encounters from room
-        encounters = self.encounter_manager.load_room_encounters(
-            {'id': self.current_room.id, 'encounters': room_encounter_data}
-        )
+        # Load the room's encounters on the first check and keep them on the room
+        if room.encounters is None:
+            room_encounter_data = self.dungeon.get_room_encounters(room.id)
+            room.encounters = self.encounter_manager.load_room_encounters(
+                {'id': room.id, 'encounters': room_encounter_data}
+            ) if room_encounter_data else []
+
+        # Most rooms have no encounters at all
+        if not room.encounters:
+            return None
 
         # Get triggered encounters
-        triggered = self.encounter_manager.get_triggered_encounters(encounters, trigger_type)
+        triggered = self.encounter_manager.get_triggered_encounters(room.encounters, trigger_type)
 
         for encounter in triggered:
             # Check if already completed
@@ -913,7 +1067,7 @@ class GameState:
 
             if isinstance(encounter, CombatEncounter):
                 # Mark as completed so it doesn't trigger again
-                self.current_room.encounters_completed.append(encounter.encounter_id)
+                self.current_room.mark_encounter_completed(encounter.encounter_id)
                 return self._start_combat(encounter)
 
         return None
@@ -922,11 +1076,12 @@ class GameState:
         """Start a combat encounter"""
 
         # Create monsters
-        self.active_monsters = []
+        monsters = []
         for monster_id in encounter.monster_ids:
             monster = self._create_monster_from_id(monster_id)
             if monster:
-                self.active_monsters.append(monster)
+                monsters.append(monster)
+        self.active_monsters = monsters
 
         self.in_combat = True
         self.current_encounter = encounter  # Track current encounter
@@ -934,6 +1089,43 @@ class GameState:
         monster_names = ', '.join(m.name for m in self.active_monsters)
         return f"\n═══ COMBAT ═══\nYou encounter: {monster_names}!\n{self._format_monster_status()}"
 
+    def _remove_monster(self, monster: Monster):
+        """Drop a slain monster from combat"""
+        index = self.active_monsters.index(monster)
+        del self.active_monsters[index]
+        del self._monster_names[index]
+
+    def _award_kill_xp(self, slain: List[Monster], messages: List[str]):
+        """
+        Award XP for slain monsters to the party (split evenly) or the player
+
+        Args:
+            slain: Monsters killed by the action
+            messages: List to append XP and level-up messages to
+        """
+
+        if not self.party:
+            for monster in slain:
+                level_up_msg = self.player.gain_xp(monster.xp_value)
+                messages.append(f"You gain {monster.xp_value} XP!")
+                if level_up_msg:
+                    messages.append(level_up_msg)
+            return
+
+        living_members = self.party.get_living_members()
+        for monster in slain:
+            if not living_members:
+                # Party wiped out - no XP awarded
+                messages.append("The party has fallen! No XP awarded.")
+                continue
+
+            xp_per_member = monster.xp_value // len(living_members)
+            for member in living_members:
+                level_up_msg = member.gain_xp(xp_per_member)
+                if level_up_msg:
+                    messages.append(f"{member.name}: {level_up_msg}")
+            messages.append(f"Party gains {monster.xp_value} XP! ({xp_per_member} each)")
+
     def _format_monster_status(self) -> str:
         """Format current monster HP/status for display"""
         if not self.active_monsters:
@@ -942,16 +1134,11 @@ class GameState:
         lines = ["\n--- Enemies ---"]
         for i, monster in enumerate(self.active_monsters, 1):
             if monster.is_alive:
-                hp_percent = (monster.hp_current / monster.hp_max) * 100
-                if hp_percent > 75:
-                    status = "Healthy"
-                elif hp_percent > 50:
-                    status = "Injured"
-                elif hp_percent > 25:
-                    status = "Badly Wounded"
-                else:
-                    status = "Near Death"
-                lines.append(f"{i}. {monster.name}: {monster.hp_current}/{monster.hp_max} HP ({status})")
+                hp_current, hp_max = monster.hp_current, monster.hp_max
+                # Quarters remaining, rounded up (integer ceil of 4*hp/max)
+                quarters = -(-4 * hp_current // hp_max)
+                status = _HEALTH_LABELS[max(0, min(3, quarters - 1))]
+                lines.append(f"{i}. {monster.name}: {hp_current}/{hp_max} HP ({status})")
             else:
                 lines.append(f"{i}. {monster.name}: DEAD")
 
@@ -982,7 +1169,7 @@ class GameState:
         # Award gems (convert to gold value, 10gp each on average)
         gems = treasure.get('gems', 0)
         if gems > 0:
-            gem_value = gems * DiceRoller.roll('2d10')  # Random gem value
+            gem_value = gems * roll_dice('2d10')  # Random gem value
             self.player.gold += gem_value
             messages.append(f"   Gems: {gems} gems worth {gem_value} gp")
 
@@ -1003,38 +1190,50 @@ class GameState:
             print("ERROR: GameData not loaded! Call load_game_data() first.")
             return None
 
-        if monster_id not in self.game_data.monsters:
-            print(f"WARNING: Monster '{monster_id}' not found in game data.")
-            return None
+        # Static constructor arguments are extracted once per monster type
+        template = self.game_data.monster_templates.get(monster_id)
+        if template is None:
+            if monster_id not in self.game_data.monsters:
+                print(f"WARNING: Monster '{monster_id}' not found in game data.")
+                return None
 
-        data = self.game_data.monsters[monster_id]
+            template = self._build_monster_template(monster_id, self.game_data.monsters[monster_id])
+            self.game_data.monster_templates[monster_id] = template
 
         # Roll HP
-        hp = DiceRoller.roll(data['hit_dice'])
-
-        monster = Monster(
-            name=data['name'],
-            race=monster_id,
-            char_class='Monster',
-            level=1,
-            hp_current=hp,
-            hp_max=hp,
-            ac=data['ac'],
-            thac0=data['thac0'],
-            size=data['size'],
-            hit_dice=data['hit_dice'],
-            damage=data['damage'],
-            treasure_type=data.get('treasure_type', 'None'),
-            xp_value=data['xp_value'],
-            movement=data['movement'],
-            morale=data['morale'],
-            special_abilities=data.get('special_abilities', []),
-            ai_behavior=data.get('ai_behavior', 'aggressive'),
-            description=data['description']
-        )
+        hp = roll_dice(template['hit_dice'])
+
+        monster = Monster(**template, hp_current=hp, hp_max=hp)
+
+        # Each monster gets its own abilities list
+        monster.special_abilities = list(monster.special_abilities)
 
         return monster
 
+    @staticmethod
+    def _build_monster_template(monster_id: str, data: Dict) -> Dict:
+        """Monster constructor arguments that don't vary between spawns"""
+
+        # special_abilities is a tuple here; each spawn gets a list copy
+        return {
+            'name': data['name'],
+            'race': monster_id,
+            'char_class': 'Monster',
+            'level': 1,
+            'ac': data['ac'],
+            'thac0': data['thac0'],
+            'size': data['size'],
+            'hit_dice': data['hit_dice'],
+            'damage': data['damage'],
+            'treasure_type': data.get('treasure_type', 'None'),
+            'xp_value': data['xp_value'],
+            'movement': data['movement'],
+            'morale': data['morale'],
+            'ai_behavior': data.get('ai_behavior', 'aggressive'),
+            'description': data['description'],
+            'special_abilities': tuple(data.get('special_abilities', []))
+        }
+
     def _create_item_from_name(self, item_name: str) -> Optional[Item]:
         """Create an item instance from name"""
 
@@ -1043,32 +1242,28 @@ class GameState:
             return None
 
         # Find item in database
-        item_data = None
-        item_key = None
+        item_key = self.game_data.find_item_key(item_name)
 
-        search_lower = item_name.lower().replace('_', ' ')
-
-        # Try exact match on key first
-        if item_name in self.game_data.items:
-            item_data = self.game_data.items[item_name]
-            item_key = item_name
-        else:
-            # Try matching on display name or key with flexible matching
-            for key, data in self.game_data.items.items():
-                key_normalized = key.lower().replace('_', ' ')
-                name_normalized = data['name'].lower()
-
-                if (key_normalized == search_lower or
-                    name_normalized == search_lower or
-                    search_lower in key_normalized or
-                    search_lower in name_normalized):
-                    item_data = data
-                    item_key = key
-                    break
-
-        if not item_data:
+        if not item_key:
             return None
 
+        # Build the item once per key, then hand out copies
+        prototype = self.game_data.item_prototypes.get(item_key)
+        if prototype is None:
+            prototype = self._build_item(self.game_data.items[item_key])
+            self.game_data.item_prototypes[item_key] = prototype
+
+        item = copy.copy(prototype)
+        item.properties = dict(prototype.properties)
+        if isinstance(item, LightSource):
+            item.turns_remaining = item.burn_time_turns
+
+        return item
+
+    @staticmethod
+    def _build_item(item_data: Dict) -> Item:
+        """Create an item instance from its items.json entry"""
+
         # Create appropriate item type
         if item_data['type'] == 'weapon':
             return Weapon(
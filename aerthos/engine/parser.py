@@ -2,10 +2,65 @@
 Natural language command parser with flexible input handling
 """
 
+from types import MappingProxyType
 from typing import Optional, List
 from dataclasses import dataclass
 
 
+# Command reference shown by the help command
+HELP_TEXT = """
+═══════════════════════════════════════════════════════════════
+AERTHOS - COMMAND REFERENCE
+═══════════════════════════════════════════════════════════════
+
+MOVEMENT:
+  go <direction>    - Move in a direction (north, south, east, west, up, down)
+  n, s, e, w        - Short forms for directions
+  directions / dirs - Show available exits from current room
+
+COMBAT:
+  attack <target>   - Attack an enemy
+  cast <spell>      - Cast a memorized spell
+
+INTERACTION:
+  take <item>       - Pick up an item
+  drop <item>       - Drop an item
+  use <item>        - Use/consume an item (potions, scrolls)
+  equip <item>      - Equip a weapon, armor, or light a torch/lantern
+  search            - Search for traps or hidden items
+  open <target>     - Open/unlock a chest or door (thieves can pick locks)
+
+INFORMATION:
+  inventory / i     - Show your inventory
+  status            - Show character status
+  map / m           - Show auto-map
+  look / examine    - Look around current room
+
+MAGIC (Spellcasters):
+  spells            - Show known spells and memorized spells
+  memorize <spell>  - Memorize a spell into an empty slot
+  cast <spell>      - Cast a memorized spell
+
+GAME MANAGEMENT:
+  rest              - Rest for 8 hours (restore HP and spells)
+  save              - Save your game
+  load              - Load a saved game
+  help / ?          - Show this help
+  quit              - Exit the game
+
+EXAMPLES:
+  attack orc
+  go north
+  take sword
+  equip longsword
+  equip torch        (to light a torch when in darkness)
+  cast magic missile
+  search carefully
+
+═══════════════════════════════════════════════════════════════
+"""
+
+
 @dataclass
 class Command:
     """Parsed command structure"""
@@ -53,8 +108,26 @@ class CommandParser:
         'quit': ['quit', 'exit', 'q']
     }
 
+    # Synonym -> normalized action. Built in reverse so that a synonym listed
+    # under several verbs ('pick') keeps the first one, as the old scan did.
+    _VERB_INDEX = MappingProxyType({
+        synonym: normalized_verb
+        for normalized_verb, synonyms in reversed(VERBS.items())
+        for synonym in synonyms
+    })
+
+    # Every verb synonym, never taken as a command's target
+    _VERB_WORDS = frozenset(_VERB_INDEX)
+
+    # Adverbs recognised as command modifiers
+    _MODIFIERS = frozenset({'carefully', 'quietly', 'quickly', 'slowly', 'stealthily', 'cautiously'})
+
     # Words to ignore
-    STOPWORDS = ['the', 'a', 'an', 'at', 'to', 'for', 'on', 'from', 'in']
+    STOPWORDS = frozenset({'the', 'a', 'an', 'at', 'to', 'for', 'on', 'from', 'in'})
+
+    # Stopwords actually dropped by _tokenize; "with" is kept for instrument
+    # parsing and "on"/"at"/"to" for spell targeting
+    _DROPPED_WORDS = STOPWORDS - {'with', 'on', 'at', 'to'}
 
     # Direction mappings
     DIRECTION_MAP = {
@@ -66,6 +139,9 @@ class CommandParser:
         'd': 'down', 'down': 'down'
     }
 
+    # Tokens that can never be a command's target noun
+    _NON_TARGET_WORDS = _VERB_WORDS | _MODIFIERS | frozenset(DIRECTION_MAP) | {'with'}
+
     def parse(self, input_text: str) -> Command:
         """
         Parse user input into a Command
@@ -123,10 +199,8 @@ class CommandParser:
             List of tokens
         """
 
-        words = text.split()
-        # Remove stopwords but keep "with" for instrument parsing and "on"/"at"/"to" for spell targeting
-        keep_words = {'with', 'on', 'at', 'to'}
-        return [w for w in words if w not in self.STOPWORDS or w in keep_words]
+        dropped = self._DROPPED_WORDS
+        return [w for w in text.split() if w not in dropped]
 
     def _extract_verb(self, tokens: List[str]) -> str:
         """
@@ -139,10 +213,11 @@ class CommandParser:
             Normalized action verb or 'invalid'
         """
 
+        verb_index = self._VERB_INDEX
         for token in tokens:
-            for normalized_verb, synonyms in self.VERBS.items():
-                if token in synonyms:
-                    return normalized_verb
+            normalized_verb = verb_index.get(token)
+            if normalized_verb:
+                return normalized_verb
 
         return 'invalid'
 
@@ -157,9 +232,11 @@ class CommandParser:
             Normalized direction or None
         """
 
+        direction_map = self.DIRECTION_MAP
         for token in tokens:
-            if token in self.DIRECTION_MAP:
-                return self.DIRECTION_MAP[token]
+            direction = direction_map.get(token)
+            if direction:
+                return direction
 
         return None
 
@@ -193,16 +270,10 @@ class CommandParser:
             except (ValueError, IndexError):
                 pass
 
-        # Get all verb words for filtering
-        verb_words = [syn for syns in self.VERBS.values() for syn in syns]
-        modifiers = ['carefully', 'quietly', 'quickly', 'slowly', 'stealthily']
-
-        # Find first noun (not verb, not modifier, not 'with')
+        # Find first noun (not verb, not modifier, not direction, not 'with')
+        non_target_words = self._NON_TARGET_WORDS
         for token in tokens:
-            if (token not in verb_words and
-                token not in modifiers and
-                token != 'with' and
-                token not in self.DIRECTION_MAP):
+            if token not in non_target_words:
                 return token
 
         return None
@@ -218,10 +289,8 @@ class CommandParser:
             Modifier string or None
         """
 
-        modifiers = ['carefully', 'quietly', 'quickly', 'slowly', 'stealthily', 'cautiously']
-
         for token in tokens:
-            if token in modifiers:
+            if token in self._MODIFIERS:
                 return token
 
         return None
@@ -249,54 +318,4 @@ class CommandParser:
     def get_help_text(self) -> str:
         """Get help text showing available commands"""
 
-        return """
-═══════════════════════════════════════════════════════════════
-AERTHOS - COMMAND REFERENCE
-═══════════════════════════════════════════════════════════════
-
-MOVEMENT:
-  go <direction>    - Move in a direction (north, south, east, west, up, down)
-  n, s, e, w        - Short forms for directions
-  directions / dirs - Show available exits from current room
-
-COMBAT:
-  attack <target>   - Attack an enemy
-  cast <spell>      - Cast a memorized spell
-
-INTERACTION:
-  take <item>       - Pick up an item
-  drop <item>       - Drop an item
-  use <item>        - Use/consume an item (potions, scrolls)
-  equip <item>      - Equip a weapon, armor, or light a torch/lantern
-  search            - Search for traps or hidden items
-  open <target>     - Open/unlock a chest or door (thieves can pick locks)
-
-INFORMATION:
-  inventory / i     - Show your inventory
-  status            - Show character status
-  map / m           - Show auto-map
-  look / examine    - Look around current room
-
-MAGIC (Spellcasters):
-  spells            - Show known spells and memorized spells
-  memorize <spell>  - Memorize a spell into an empty slot
-  cast <spell>      - Cast a memorized spell
-
-GAME MANAGEMENT:
-  rest              - Rest for 8 hours (restore HP and spells)
-  save              - Save your game
-  load              - Load a saved game
-  help / ?          - Show this help
-  quit              - Exit the game
-
-EXAMPLES:
-  attack orc
-  go north
-  take sword
-  equip longsword
-  equip torch        (to light a torch when in darkness)
-  cast magic missile
-  search carefully
-
-═══════════════════════════════════════════════════════════════
-"""
+        return HELP_TEXT
@@ -2,6 +2,7 @@
 Time tracking system - manages turns, light sources, and resource consumption
 """
 
+import random
 from typing import List, Optional, Dict
 from ..entities.player import PlayerCharacter, LightSource
 
@@ -32,10 +33,11 @@ class TimeTracker:
         self.turns_elapsed += 1
         messages = []
 
-        # Consume light
-        light_msg = self._consume_light(player)
-        if light_msg:
-            messages.append(light_msg)
+        # Consume light (most turns in lit rooms have no light source to burn)
+        if player.equipment.light_source:
+            light_msg = self._consume_light(player)
+            if light_msg:
+                messages.append(light_msg)
 
         # Every 6 turns (1 hour)
         if self.turns_elapsed % 6 == 0:
@@ -48,6 +50,50 @@ class TimeTracker:
 
         return messages
 
+    def advance_turns(self, player: PlayerCharacter, turns: int) -> List[str]:
+        """
+        Advance time by several turns at once (e.g. an 8-hour rest)
+
+        Equivalent to calling advance_turn() repeatedly, but light burn-down
+        is applied in chunks up to each burn-out instead of one turn at a time.
+
+        Args:
+            player: The player character
+            turns: Number of turns to advance
+
+        Returns:
+            Event messages from the final turn only
+        """
+
+        if turns <= 0:
+            return []
+
+        messages = []
+
+        # Burn each light source down to the turn it changes state, then let
+        # _consume_light handle that turn (burn-out, auto-relight, warnings)
+        remaining = turns
+        while remaining and player.equipment.light_source:
+            light_source = player.equipment.light_source
+            burn = min(remaining, max(light_source.turns_remaining, 1))
+            light_source.turns_remaining -= burn - 1
+            remaining -= burn
+
+            light_msg = self._consume_light(player)
+            if light_msg and not remaining:
+                messages.append(light_msg)
+
+        hours_before = self.turns_elapsed // 6
+        self.turns_elapsed += turns
+        self.total_hours += self.turns_elapsed // 6 - hours_before
+
+        if self.turns_elapsed % 6 == 0:
+            hunger_msg = self._check_hunger(player)
+            if hunger_msg:
+                messages.append(hunger_msg)
+
+        return messages
+
     def _consume_light(self, player: PlayerCharacter) -> Optional[str]:
         """
         Decrease active light source duration and auto-equip new light sources
@@ -94,9 +140,9 @@ class TimeTracker:
         Returns:
             LightSource if found, None otherwise
         """
-        for item in player.inventory.items:
-            if isinstance(item, LightSource) and item != player.equipment.light_source:
-                return item
+        for light_source in player.inventory.light_sources:
+            if light_source != player.equipment.light_source:
+                return light_source
         return None
 
     def _check_hunger(self, player: PlayerCharacter) -> Optional[str]:
@@ -166,7 +212,6 @@ class RestSystem:
             }
 
         # Random encounter check (15% chance of interruption)
-        import random
         if random.random() < 0.15:
             return {
                 'success': False,
@@ -212,8 +257,6 @@ class RestSystem:
             Amount of HP recovered
         """
 
-        import random
-
         if player.hp_current >= player.hp_max:
             return 0
 
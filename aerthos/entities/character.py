@@ -6,6 +6,9 @@ Implements core AD&D 1e attributes and combat stats
 from typing import List, Optional
 from dataclasses import dataclass, field
 
+# Size categories that use a weapon's small/medium damage dice
+SMALL_MEDIUM_SIZES = frozenset({'S', 'M'})
+
 
 @dataclass
 class Character:
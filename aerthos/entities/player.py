@@ -24,6 +24,15 @@ class Item:
     properties: Dict = field(default_factory=dict)
     description: str = ""
 
+    # What 'use' does with a consumable: 'potion', 'ration' or 'other'
+    use_kind: str = field(default='other', init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if 'healing' in self.properties:
+            self.use_kind = 'potion'
+        elif 'ration' in self.name.lower():
+            self.use_kind = 'ration'
+
     def __str__(self):
         return self.name
 
@@ -37,6 +46,7 @@ class Weapon(Item):
     magic_bonus: int = 0    # +1, +2, etc. for magic weapons
 
     def __post_init__(self):
+        super().__post_init__()
         self.item_type = 'weapon'
 
 
@@ -47,6 +57,7 @@ class Armor(Item):
     magic_bonus: int = 0  # +1, +2, etc. for magic armor (improves AC further)
 
     def __post_init__(self):
+        super().__post_init__()
         self.item_type = 'armor'
 
 
@@ -58,10 +69,15 @@ class LightSource(Item):
     light_radius: int = 30
 
     def __post_init__(self):
+        super().__post_init__()
         self.item_type = 'light_source'
         self.turns_remaining = self.burn_time_turns
 
 
+# Spell-name keywords that mark a spell as beneficial (cast on the party)
+BENEFICIAL_SPELL_KEYWORDS = ('cure', 'heal', 'bless', 'protection', 'shield', 'aid')
+
+
 @dataclass
 class Spell:
     """Spell definition"""
@@ -76,6 +92,12 @@ class Spell:
     components: str
     description: str
     class_availability: List[str] = field(default_factory=list)
+    # Healing/buff spell that targets the party rather than monsters
+    is_beneficial: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        name = self.name.lower()
+        self.is_beneficial = any(keyword in name for keyword in BENEFICIAL_SPELL_KEYWORDS)
 
 
 @dataclass
@@ -90,13 +112,31 @@ class Inventory:
     """Character inventory with encumbrance"""
 
     def __init__(self, max_weight: int = 100):
-        self.items: List[Item] = []
+        self._items: List[Item] = []
+        self._weight = 0
+        self._light_sources: List[LightSource] = []
         self.max_weight = max_weight
 
+    @property
+    def items(self) -> List[Item]:
+        """Carried items; change through add_item/remove_item or reassign"""
+        return self._items
+
+    @items.setter
+    def items(self, items: List[Item]):
+        self._items = items
+        self._weight = sum(item.weight for item in items)
+        self._light_sources = [item for item in items if isinstance(item, LightSource)]
+
+    @property
+    def light_sources(self) -> List[LightSource]:
+        """Carried light sources, in inventory order"""
+        return self._light_sources
+
     @property
     def current_weight(self) -> float:
         """Total weight carried"""
-        return sum(item.weight for item in self.items)
+        return self._weight
 
     @property
     def is_encumbered(self) -> bool:
@@ -105,7 +145,10 @@ class Inventory:
 
     def add_item(self, item: Item) -> bool:
         """Add item to inventory"""
-        self.items.append(item)
+        self._items.append(item)
+        self._weight += item.weight
+        if isinstance(item, LightSource):
+            self._light_sources.append(item)
         return True
 
     def remove_item(self, item_name: str) -> Optional[Item]:
@@ -116,18 +159,26 @@ class Inventory:
         for item in self.items:
             item_name_normalized = item.name.lower().replace('_', ' ')
             if item_name_normalized == search_lower:
-                self.items.remove(item)
+                self._discard(item)
                 return item
 
         # Then try partial match (search term is in item name)
         for item in self.items:
             item_name_normalized = item.name.lower().replace('_', ' ')
             if search_lower in item_name_normalized:
-                self.items.remove(item)
+                self._discard(item)
                 return item
 
         return None
 
+    def _discard(self, item: Item):
+        """Take an item out of the list and re-total the weight"""
+        self._items.remove(item)
+        # Summed afresh (not subtracted) so float weights never drift
+        self._weight = sum(i.weight for i in self._items)
+        if isinstance(item, LightSource):
+            self._light_sources.remove(item)
+
     def has_item(self, item_name: str) -> bool:
         """Check if item exists in inventory"""
         return any(item.name.lower() == item_name.lower() for item in self.items)
@@ -308,6 +359,18 @@ class PlayerCharacter(Character):
         """Add an empty spell slot"""
         self.spells_memorized.append(SpellSlot(level=level))
 
+    def find_known_spell(self, name: str) -> Optional[Spell]:
+        """Find a known spell by name (case-insensitive, exact match preferred)"""
+        search = name.lower()
+        partial = None
+        for spell in self.spells_known:
+            spell_name = spell.name.lower()
+            if spell_name == search:
+                return spell
+            if partial is None and search in spell_name:
+                partial = spell
+        return partial
+
     def memorize_spell(self, spell: Spell) -> bool:
         """Memorize a spell into an available slot"""
         if spell not in self.spells_known:
@@ -341,8 +404,8 @@ class PlayerCharacter(Character):
 
         return False
 
-    def use_spell_slot(self, spell_name: str) -> Optional[Spell]:
-        """Use a spell slot, returns the spell if successful (supports partial matching)"""
+    def _find_ready_slot(self, spell_name: str) -> Optional[SpellSlot]:
+        """Find an unused slot holding the named spell (supports partial matching)"""
         search_lower = spell_name.lower()
 
         # First try exact match
@@ -350,19 +413,31 @@ class PlayerCharacter(Character):
             if (slot.spell and
                 slot.spell.name.lower() == search_lower and
                 not slot.is_used):
-                slot.is_used = True
-                return slot.spell
+                return slot
 
         # Then try partial match (search term is in spell name)
         for slot in self.spells_memorized:
             if (slot.spell and
                 search_lower in slot.spell.name.lower() and
                 not slot.is_used):
-                slot.is_used = True
-                return slot.spell
+                return slot
 
         return None
 
+    def find_memorized_spell(self, spell_name: str) -> Optional[Spell]:
+        """Get the spell use_spell_slot() would cast, without using the slot"""
+        slot = self._find_ready_slot(spell_name)
+        return slot.spell if slot else None
+
+    def use_spell_slot(self, spell_name: str) -> Optional[Spell]:
+        """Use a spell slot, returns the spell if successful (supports partial matching)"""
+        slot = self._find_ready_slot(spell_name)
+        if not slot:
+            return None
+
+        slot.is_used = True
+        return slot.spell
+
     def restore_spells(self):
         """Restore all spell slots (after rest)"""
         for slot in self.spells_memorized:
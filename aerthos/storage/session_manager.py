@@ -119,7 +119,7 @@ class SessionManager:
         session_data['current_room_id'] = game_state.current_room.id if game_state.current_room else None
 
         # Save party state (updated character stats, inventory, etc.)
-        if hasattr(game_state, 'party') and game_state.party:
+        if game_state.party:
             session_data['party_state'] = self._serialize_party(game_state.party)
         elif hasattr(game_state, 'player'):
             # Single player - save as single member party
@@ -5,7 +5,7 @@ Vancian Magic System - AD&D 1e spell memorization and casting
 import random
 from typing import Dict, List, Optional
 from ..entities.player import PlayerCharacter, Spell
-from ..entities.character import Character
+from ..entities.character import Character, SMALL_MEDIUM_SIZES
 from ..systems.saving_throws import SavingThrowResolver
 
 
@@ -251,7 +251,7 @@ class MagicSystem:
         target = targets[0]
 
         # Check if target is person (humanoid)
-        if target.size not in ['S', 'M']:
+        if target.size not in SMALL_MEDIUM_SIZES:
             return {
                 'narrative': f"{target.name} is not a person - spell fails!",
                 'affected': []
@@ -30,6 +30,11 @@ class SaveSystem:
             description: Optional description for this save
         """
 
+        self._write_save(slot, self._encode_save(game_state, description))
+
+    def _encode_save(self, game_state, description: str) -> str:
+        """Snapshot game state as save-file JSON text"""
+
         save_data = {
             'timestamp': datetime.now().isoformat(),
             'description': description,
@@ -41,10 +46,21 @@ class SaveSystem:
             'total_hours': game_state.time_tracker.total_hours
         }
 
+        return json.dumps(save_data, indent=2)
+
+    def _write_save(self, slot: int, text: str):
+        """Write encoded save text to a slot"""
+
         filepath = self.save_dir / f'save_{slot}.json'
 
-        with open(filepath, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        # Write beside the save and swap it in, so a reader never sees half a file
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        try:
+            tmp_path.write_text(text)
+            tmp_path.replace(filepath)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def load_game(self, slot: int = 1) -> Optional[dict]:
         """
@@ -3,6 +3,7 @@ Dungeon class - manages the game world and navigation
 """
 
 import json
+import sys
 from typing import Dict, Optional, List
 from pathlib import Path
 from .room import Room
@@ -47,7 +48,7 @@ class Dungeon:
                 items=room_data.get('items', []),
                 is_safe_for_rest=room_data.get('safe_rest', False)
             )
-            rooms[room_id] = room
+            rooms[sys.intern(room_id)] = room
 
         return cls(name, start_room_id, rooms, data['rooms'])
 
@@ -77,7 +78,7 @@ class Dungeon:
                 items=room_data.get('items', []),
                 is_safe_for_rest=room_data.get('safe_rest', False)
             )
-            rooms[room_id] = room
+            rooms[sys.intern(room_id)] = room
 
         return cls(name, start_room_id, rooms, dungeon_data['rooms'])
 
@@ -130,7 +131,7 @@ class Dungeon:
                 room_id: {
                     'is_explored': room.is_explored,
                     'items': room.items,
-                    'encounters_completed': room.encounters_completed
+                    'encounters_completed': sorted(room.encounters_completed)
                 }
                 for room_id, room in self.rooms.items()
             }
@@ -184,6 +185,6 @@ class Dungeon:
                 room = dungeon.rooms[room_id]
                 room.is_explored = state.get('is_explored', False)
                 room.items = state.get('items', [])
-                room.encounters_completed = state.get('encounters_completed', [])
+                room.encounters_completed = set(state.get('encounters_completed', []))
 
         return dungeon
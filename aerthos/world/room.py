@@ -2,10 +2,35 @@
 Room class - represents a single location in the dungeon
 """
 
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 
+# Order in which exits are listed to the player
+EXIT_ORDER = ('north', 'south', 'east', 'west', 'up', 'down')
+
+# Room description rewrites once a room's monsters are defeated
+DEFEATED_REPLACEMENTS = {
+    # Monster activity -> defeated state
+    'guards a pile': 'once guarded a pile',
+    'guards the': 'once guarded the',
+    'turn their empty eye sockets toward you and advance': 'lie scattered about, their bones still',
+    'weapons raised': 'weapons scattered nearby',
+    'does not look pleased to see you': 'lies dead on the ground',
+    'advance': 'lie defeated',
+    'charges': 'lies dead',
+    'attacks': 'lies dead',
+
+    # Specific boss/monster descriptions
+    'an enormous OGRE guards': 'the corpse of a massive OGRE lies beside',
+    'The beast is nine feet tall, with muscles like iron. This is the master of the mine, and it does not look pleased to see you!': 'The defeated beast lies in a pool of its own blood.',
+
+    # Skeleton descriptions
+    'They turn their empty eye sockets toward you and advance, weapons raised!': 'The shattered remains of skeletons lie scattered across the floor, their dark magic broken.',
+}
+
+
 @dataclass
 class Room:
     """A single room in the dungeon"""
@@ -20,7 +45,31 @@ class Room:
     is_safe_for_rest: bool = False
 
     # Encounter tracking
-    encounters_completed: List[str] = field(default_factory=list)
+    encounters_completed: Set[str] = field(default_factory=set)
+
+    # Capitalized exits in EXIT_ORDER (exits don't change once built)
+    exits_display: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    # Encounter objects for this room, loaded on the first encounter check
+    encounters: Optional[List] = field(default=None, init=False, repr=False, compare=False)
+
+    # (encounter_id, data, lock_penalty) for each locked chest, filled in on
+    # first 'open'; lock_penalty is subtracted from a thief's Open Locks chance
+    locked_chests: Optional[List[Tuple[str, Dict, int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Pieces of the full description that don't change once the room is built
+    exits_text: str = field(init=False, repr=False, compare=False)
+    defeated_description: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Room ids are compared and hashed on every move; intern them so the
+        # dungeon's room table lookups hit on identity
+        self.id = sys.intern(self.id)
+        self.exits = {direction: sys.intern(room_id) for direction, room_id in self.exits.items()}
+        self.exits_display = tuple(d.capitalize() for d in EXIT_ORDER if d in self.exits)
+        self.exits_text = f"\n\nExits: {', '.join(self.exits)}" if self.exits else ""
 
     def on_enter(self, has_light: bool, player=None) -> str:
         """
@@ -49,9 +98,7 @@ class Room:
 
         # Check if player has unlit torches/lanterns
         if player:
-            from ..entities.player import LightSource
-            has_light_items = any(isinstance(item, LightSource) for item in player.inventory.items)
-            if has_light_items:
+            if player.inventory.light_sources:
                 msg += "\n\n💡 Hint: Type 'equip torch' to light a torch from your inventory."
 
         return msg
@@ -62,12 +109,7 @@ class Room:
         # Modify description if combat encounters are completed
         description = self._get_modified_description()
 
-        desc = f"**{self.title}**\n\n{description}"
-
-        # Add exits
-        if self.exits:
-            exit_list = ', '.join(self.exits.keys())
-            desc += f"\n\nExits: {exit_list}"
+        desc = f"**{self.title}**\n\n{description}{self.exits_text}"
 
         # Add visible items
         if self.items:
@@ -89,35 +131,16 @@ class Room:
         if not has_completed_combat:
             return self.description
 
-        # Modify description to show defeated monsters instead of threatening ones
-        modified = self.description
-
-        # Common replacements for defeated monsters
-        replacements = {
-            # Monster activity -> defeated state
-            'guards a pile': 'once guarded a pile',
-            'guards the': 'once guarded the',
-            'turn their empty eye sockets toward you and advance': 'lie scattered about, their bones still',
-            'weapons raised': 'weapons scattered nearby',
-            'does not look pleased to see you': 'lies dead on the ground',
-            'advance': 'lie defeated',
-            'charges': 'lies dead',
-            'attacks': 'lies dead',
-
-            # Specific boss/monster descriptions
-            'an enormous OGRE guards': 'the corpse of a massive OGRE lies beside',
-            'The beast is nine feet tall, with muscles like iron. This is the master of the mine, and it does not look pleased to see you!': 'The defeated beast lies in a pool of its own blood.',
-
-            # Skeleton descriptions
-            'They turn their empty eye sockets toward you and advance, weapons raised!': 'The shattered remains of skeletons lie scattered across the floor, their dark magic broken.',
-        }
+        # Modify description to show defeated monsters instead of threatening
+        # ones; the result only depends on the base text, so build it once
+        if self.defeated_description is None:
+            modified = self.description
+            for old, new in DEFEATED_REPLACEMENTS.items():
+                if old in modified:
+                    modified = modified.replace(old, new)
+            self.defeated_description = modified
 
-        # Apply replacements
-        for old, new in replacements.items():
-            if old in modified:
-                modified = modified.replace(old, new)
-
-        return modified
+        return self.defeated_description
 
     def has_exit(self, direction: str) -> bool:
         """Check if room has an exit in the given direction"""
@@ -153,24 +176,23 @@ class Room:
         Returns:
             Full item name if found, None otherwise
         """
-        search_lower = search_term.lower()
-
-        # First try exact match
-        for item in self.items:
-            if item.lower() == search_lower:
-                return item
+        search_folded = search_term.casefold()
 
-        # Then try partial match (search term is in item name)
+        # One pass: an exact match wins outright, otherwise the first
+        # item containing the search term
+        partial_match = None
         for item in self.items:
-            if search_lower in item.lower().replace('_', ' '):
+            item_folded = item.casefold()
+            if item_folded == search_folded:
                 return item
+            if partial_match is None and search_folded in item_folded.replace('_', ' '):
+                partial_match = item
 
-        return None
+        return partial_match
 
     def mark_encounter_completed(self, encounter_id: str):
         """Mark an encounter as completed"""
-        if encounter_id not in self.encounters_completed:
-            self.encounters_completed.append(encounter_id)
+        self.encounters_completed.add(encounter_id)
 
     def is_encounter_completed(self, encounter_id: str) -> bool:
         """Check if an encounter has been completed"""
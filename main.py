@@ -408,7 +408,7 @@ def restore_game_from_save(save_data: dict, game_data: GameData) -> tuple:
                 room = dungeon.rooms[room_id]
                 room.is_explored = state.get('is_explored', False)
                 room.items = state.get('items', [])
-                room.encounters_completed = state.get('encounters_completed', [])
+                room.encounters_completed = set(state.get('encounters_completed', []))
 
         return player, dungeon
 
@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch
 from aerthos.engine.combat import DiceRoller, CombatResolver
 from aerthos.entities.character import Character
 from aerthos.entities.player import PlayerCharacter, Weapon
+from aerthos.entities.monster import Monster
 
 
 class TestDiceRoller(unittest.TestCase):
@@ -25,6 +26,12 @@ class TestDiceRoller(unittest.TestCase):
             self.assertGreaterEqual(roll, 1)
             self.assertLessEqual(roll, 20)
 
+    def test_roll_3d6_and_d100_range(self):
+        """Test 3d6 and d100 rolls are in valid range"""
+        for _ in range(100):
+            self.assertTrue(3 <= self.roller.roll_3d6() <= 18)
+            self.assertTrue(1 <= self.roller.roll_d100() <= 100)
+
     def test_roll_single_die(self):
         """Test rolling single die using roll() method"""
         for _ in range(50):
@@ -73,6 +80,33 @@ class TestDiceRoller(unittest.TestCase):
             self.assertGreaterEqual(roll, 0)
             self.assertLessEqual(roll, 7)
 
+    def test_roll_flat_values(self):
+        """Test flat hit dice values like '4+1' use integer arithmetic"""
+        self.assertEqual(self.roller.roll("4+1"), 5)
+        self.assertEqual(self.roller.roll("3-1"), 2)
+        self.assertEqual(self.roller.roll("7"), 7)
+
+        with self.assertRaises(ValueError):
+            self.roller.roll("4+1+1")
+        with self.assertRaises(ValueError):
+            self.roller.roll("__import__('os')")
+
+    def test_module_level_functions(self):
+        """Test dice rolls are available as plain module functions"""
+        from aerthos.engine import combat
+
+        self.assertIs(DiceRoller.roll, combat.roll)
+        self.assertTrue(1 <= combat.roll_d20() <= 20)
+        self.assertEqual(combat.roll("4+1"), 5)
+
+    def test_roll_batch(self):
+        """Test batched rolls return the requested count within range"""
+        rolls = self.roller.roll_batch(20, 50)
+        self.assertEqual(len(rolls), 50)
+        for roll in rolls:
+            self.assertGreaterEqual(roll, 1)
+            self.assertLessEqual(roll, 20)
+
 
 class TestCombatResolver(unittest.TestCase):
     """Test THAC0 combat resolution"""
@@ -171,6 +205,20 @@ class TestCombatResolver(unittest.TestCase):
                 # Damage should be rolled value (2) + damage bonus (0) = 2
                 self.assertEqual(result['damage'], 2)
 
+    def test_critical_hit_doubles_damage(self):
+        """Test natural 20 doubles damage, with a minimum of 1"""
+        attacker = self.create_test_character("Attacker", thac0=20)
+        defender = self.create_test_character("Defender", ac=10)
+
+        with patch.object(self.resolver.dice_roller, 'roll', return_value=2):
+            result = self.resolver.attack_roll(attacker, defender, roll=20)
+            self.assertEqual(result['damage'], 4)
+
+        attacker.get_damage_bonus = Mock(return_value=-5)
+        with patch.object(self.resolver.dice_roller, 'roll', return_value=2):
+            result = self.resolver.attack_roll(attacker, defender, roll=20)
+            self.assertEqual(result['damage'], 1)
+
     def test_no_damage_on_miss(self):
         """Test no damage dealt on miss"""
         attacker = self.create_test_character("Attacker", thac0=20)
@@ -260,6 +308,87 @@ class TestCombatIntegration(unittest.TestCase):
             self.assertTrue(result['hit'])
             self.assertIn('damage', result)
 
+    def test_attack_rolls_batch_whole_side(self):
+        """Test batch resolution gives one result per able attacker"""
+        orcs = [Monster(name="Orc", race="orc", char_class="Monster",
+                        hp_current=10, hp_max=10) for _ in range(3)]
+        fighter = PlayerCharacter(name="Fighter", race="Human", char_class="Fighter",
+                                  hp_current=200, hp_max=200)
+
+        results = self.resolver.attack_rolls_batch(orcs, [fighter])
+
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIn('hit', result)
+            self.assertIn('narrative', result)
+
+    def test_attack_rolls_batch_skips_incapacitated(self):
+        """Test sleeping attackers do not act in a batch"""
+        orc = Monster(name="Orc", race="orc", char_class="Monster",
+                      hp_current=10, hp_max=10)
+        orc.add_condition('sleeping')
+        fighter = PlayerCharacter(name="Fighter", race="Human", char_class="Fighter",
+                                  hp_current=20, hp_max=20)
+
+        self.assertEqual(self.resolver.attack_rolls_batch([orc], [fighter]), [])
+
+    def test_attack_rolls_batch_never_targets_the_slain(self):
+        """Test each kill leaves the pool so later attackers pick survivors"""
+        fighters = [PlayerCharacter(name=f"Fighter {i}", race="Human", char_class="Fighter",
+                                    hp_current=20, hp_max=20) for i in range(10)]
+        kobolds = [Monster(name="Kobold", race="kobold", char_class="Monster",
+                           hp_current=1, hp_max=1) for _ in range(4)]
+
+        with patch.object(self.resolver.dice_roller, 'roll_batch', return_value=[20] * 10):
+            results = self.resolver.attack_rolls_batch(fighters, kobolds)
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result['defender_died'] for result in results))
+        self.assertFalse(any(kobold.is_alive for kobold in kobolds))
+
+    def test_simulate_without_narration(self):
+        """Test simulation runs rounds and reports counters only"""
+        orcs = [Monster(name="Orc", race="orc", char_class="Monster",
+                        hp_current=4, hp_max=4) for _ in range(2)]
+        fighter = PlayerCharacter(name="Fighter", race="Human", char_class="Fighter",
+                                  hp_current=500, hp_max=500, thac0=1)
+
+        totals = self.resolver.simulate([fighter], orcs, rounds=100)
+
+        self.assertTrue(totals['party_won'])
+        self.assertFalse(totals['monsters_won'])
+        self.assertLess(totals['rounds'], 100)
+        self.assertGreater(totals['hits'], 0)
+        self.assertGreaterEqual(totals['damage'], totals['hits'])
+
+    def test_specialize_reuses_stats(self):
+        """Test a specialized round resolver snapshots stats only once"""
+        orc = Monster(name="Orc", race="orc", char_class="Monster",
+                      hp_current=50, hp_max=50)
+        fighter = PlayerCharacter(name="Fighter", race="Human", char_class="Fighter",
+                                  hp_current=50, hp_max=50)
+
+        with patch.object(self.resolver, '_snapshot_side',
+                          wraps=self.resolver._snapshot_side) as snapshot:
+            run_round = self.resolver.specialize([fighter], [orc])
+            for _ in range(3):
+                result = run_round()
+                self.assertIn('actions', result)
+
+        self.assertEqual(snapshot.call_count, 2)
+
+    def test_attack_roll_without_narration(self):
+        """Test narration can be skipped for a single attack"""
+        orc = Monster(name="Orc", race="orc", char_class="Monster",
+                      hp_current=10, hp_max=10)
+        fighter = PlayerCharacter(name="Fighter", race="Human", char_class="Fighter",
+                                  hp_current=20, hp_max=20)
+
+        result = self.resolver.attack_roll(fighter, orc, roll=15, narrate=False)
+
+        self.assertIsNone(result['narrative'])
+        self.assertEqual(result['roll'], 15)
+
     def test_combat_until_death(self):
         """Test combat continues until death"""
         attacker = Mock(spec=Character)
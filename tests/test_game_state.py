@@ -14,9 +14,12 @@ from pathlib import Path
 
 from aerthos.engine.game_state import GameState, GameData
 from aerthos.engine.parser import Command
-from aerthos.entities.player import PlayerCharacter
+from aerthos.entities.player import PlayerCharacter, Item, LightSource, Weapon, Spell, SpellSlot
 from aerthos.world.dungeon import Dungeon
 from aerthos.world.room import Room
+from aerthos.entities.party import Party
+from aerthos.world.encounter import CombatEncounter
+from aerthos.ui.save_system import SaveSystem
 
 
 class TestGameData(unittest.TestCase):
@@ -99,6 +102,64 @@ class TestGameData(unittest.TestCase):
         self.assertIn('name', spell)
         self.assertIn('level', spell)
 
+    def test_load_all_cache_tracks_file_changes(self):
+        """Test the parsed-data cache is refreshed when a JSON file changes"""
+        with tempfile.TemporaryDirectory() as data_dir:
+            for name in GameData.DATA_FILES:
+                Path(data_dir, f"{name}.json").write_text('{}')
+
+            items_path = Path(data_dir, "items.json")
+            items_path.write_text('{"torch": {"name": "Torch"}}')
+            data = GameData.load_all(data_dir)
+            self.assertTrue(Path(data_dir, "items.json.cache").exists())
+            self.assertEqual(data.items, {"torch": {"name": "Torch"}})
+
+            items_path.write_text('{"rope": {"name": "Rope", "x": 1}}')
+            data = GameData.load_all(data_dir)
+            self.assertEqual(data.items, {"rope": {"name": "Rope", "x": 1}})
+
+    def test_load_all_rebuilds_unreadable_cache(self):
+        """Test a cache that fails to unpickle falls back to the JSON"""
+        with tempfile.TemporaryDirectory() as data_dir:
+            for name in GameData.DATA_FILES:
+                Path(data_dir, f"{name}.json").write_text('{}')
+            Path(data_dir, "items.json").write_text('{"torch": {"name": "Torch"}}')
+
+            # Unpickling this raises AttributeError (no such name in builtins)
+            cache_path = Path(data_dir, "items.json.cache")
+            cache_path.write_bytes(b"cbuiltins\nno_such_name\n.")
+
+            data = GameData.load_all(data_dir)
+
+            self.assertEqual(data.items, {"torch": {"name": "Torch"}})
+            self.assertEqual(GameData.load_all(data_dir).items, data.items)
+            self.assertEqual(list(Path(data_dir).glob("*.tmp")), [])
+
+    def test_find_item_key(self):
+        """Test item lookup by key, display name and partial name"""
+        data = GameData.load_all()
+
+        self.assertEqual(data.find_item_key('torch'), 'torch')
+        self.assertEqual(data.find_item_key('Torch'), 'torch')
+        self.assertEqual(data.find_item_key('plate'), 'plate_mail')
+        self.assertIsNone(data.find_item_key('no such thing'))
+
+    def test_find_item_key_follows_item_table_changes(self):
+        """Test item lookups aren't served from a stale index or memo"""
+        data = GameData()
+        data.items = {'iron_dagger': {'name': 'Iron Dagger'}}
+        self.assertEqual(data.find_item_key('dagger'), 'iron_dagger')
+        self.assertIsNone(data.find_item_key('rope'))
+        self.assertIn('rope', data.partial_item_matches)
+
+        # Replaced with the same number of items
+        data.items = {'silver_dagger': {'name': 'Silver Dagger'}}
+        self.assertEqual(data.find_item_key('dagger'), 'silver_dagger')
+
+        # A name that missed before is found once the item exists
+        data.items['hemp_rope'] = {'name': 'Hemp Rope'}
+        self.assertEqual(data.find_item_key('rope'), 'hemp_rope')
+
 
 class TestGameStateInitialization(unittest.TestCase):
     """Test GameState initialization"""
@@ -249,6 +310,118 @@ class TestGameStateCommands(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIn('message', result)
 
+    def test_inventory_marks_equipped_item(self):
+        """Test only the equipped copy of an item is marked"""
+        equipped = Weapon(name="Dagger", weight=1)
+        spare = Weapon(name="Dagger", weight=1)
+        self.player.inventory.items = [equipped, spare]
+        self.player.equipment.weapon = equipped
+
+        result = self.game_state.execute_command(Command(action="inventory"))
+
+        lines = result['message'].split('\n')
+        self.assertIn("  - Dagger (1 lbs) [EQUIPPED - WEAPON]", lines)
+        self.assertIn("  - Dagger (1 lbs)", lines)
+
+    def test_inventory_tracks_light_sources(self):
+        """Test the inventory's light-source list follows adds, removes and reassignment"""
+        inventory = self.player.inventory
+        torch = LightSource(name="Torch", weight=1, burn_time_turns=6, light_radius=30)
+        inventory.items = [Item(name="Rope", item_type="gear", weight=5)]
+        self.assertEqual(inventory.light_sources, [])
+
+        inventory.add_item(torch)
+        self.assertEqual(inventory.light_sources, [torch])
+
+        inventory.remove_item("torch")
+        self.assertEqual(inventory.light_sources, [])
+
+        inventory.items = [torch]
+        self.assertEqual(inventory.light_sources, [torch])
+
+    def test_equip_weapon_and_light(self):
+        """Test equipping routes each item type to its slot"""
+        sword = Weapon(name="Long Sword", weight=4)
+        torch = LightSource(name="Torch", weight=1)
+        self.player.inventory.items = [sword, torch]
+
+        result = self.game_state.execute_command(Command(action="equip", target="long sword"))
+        self.assertEqual(result['message'], "You equip the Long Sword.")
+        self.assertIs(self.player.equipment.weapon, sword)
+
+        result = self.game_state.execute_command(Command(action="equip", target="torch"))
+        self.assertEqual(result['message'], "You light the Torch.")
+        self.assertIs(self.player.equipment.light_source, torch)
+
+    def test_use_ration_points_to_rest(self):
+        """Test using a ration explains that rations are eaten while resting"""
+        self.player.inventory.items = [Item(name="Iron Rations", item_type="consumable", weight=1)]
+
+        result = self.game_state.execute_command(Command(action="use", target="iron rations"))
+
+        self.assertFalse(result['success'])
+        self.assertIn("rest", result['message'])
+
+    def make_spell(self, name):
+        """Helper to create a level 1 spell"""
+        return Spell(name=name, level=1, school="Abjuration", casting_time="1",
+                     range="Touch", duration="1 turn", area_of_effect="1 creature",
+                     saving_throw="None", components="V,S", description="")
+
+    def test_memorize_prefers_exact_spell_name(self):
+        """Test memorize picks an exact name match over an earlier partial one"""
+        self.player.spells_known = [self.make_spell("Light Shield"), self.make_spell("Light")]
+        self.player.spells_memorized = [SpellSlot(level=1)]
+
+        result = self.game_state.execute_command(Command(action="memorize", target="light"))
+
+        self.assertTrue(result['success'])
+        self.assertEqual(self.player.spells_memorized[0].spell.name, "Light")
+
+    def test_cast_abbreviated_healing_spell_targets_caster(self):
+        """Test an abbreviated healing spell is cast on the caster outside combat"""
+        self.player.spells_memorized = [SpellSlot(level=1, spell=self.make_spell("Cure Light Wounds"))]
+        self.player.hp_current = 1
+
+        result = self.game_state.execute_command(Command(action="cast", target="cu"))
+
+        self.assertTrue(result['success'])
+        self.assertGreater(self.player.hp_current, 1)
+
+    def test_cast_abbreviated_attack_spell_needs_enemies(self):
+        """Test an abbreviation resolves to the memorized spell, not a healing keyword"""
+        self.player.spells_memorized = [SpellSlot(level=1, spell=self.make_spell("Shocking Grasp"))]
+
+        result = self.game_state.execute_command(Command(action="cast", target="c"))
+
+        self.assertFalse(result['success'])
+        self.assertIn("no enemies", result['message'])
+        self.assertFalse(self.player.spells_memorized[0].is_used)
+
+    def test_advance_turns_burns_through_spare_lights(self):
+        """Test batched time advance burns out lights and reports the final turn"""
+        first = LightSource(name="Torch", weight=1, burn_time_turns=10, light_radius=30)
+        spare = LightSource(name="Torch", weight=1, burn_time_turns=6, light_radius=30)
+        self.player.inventory.items = [first, spare]
+        self.player.equip_light(first)
+
+        tracker = self.game_state.time_tracker
+        messages = tracker.advance_turns(self.player, 48)
+
+        self.assertIsNone(self.player.equipment.light_source)
+        self.assertEqual(self.player.inventory.items, [])
+        self.assertEqual((tracker.turns_elapsed, tracker.total_hours), (48, 8))
+        self.assertEqual(len(messages), 1)
+        self.assertIn("hungry", messages[0])
+
+    def test_item_subclasses_get_use_kind(self):
+        """Test weapon/armor/light subclasses run the base item setup"""
+        lantern = LightSource(name="Healing Lantern", weight=2, properties={'healing': '1d4'})
+        rations = Weapon(name="Ration Tin", weight=1)
+
+        self.assertEqual((lantern.item_type, lantern.use_kind), ('light_source', 'potion'))
+        self.assertEqual((rations.item_type, rations.use_kind), ('weapon', 'ration'))
+
     def test_status_command(self):
         """Test status command"""
         cmd = Command(action="status")
@@ -278,6 +451,43 @@ class TestGameStateCommands(unittest.TestCase):
         # Should not have moved
         self.assertEqual(self.game_state.current_room.id, "test_001")
 
+    def test_directions_command(self):
+        """Test directions lists the room's exits"""
+        cmd = Command(action="directions")
+        result = self.game_state.execute_command(cmd)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['message'], "Available exits: North")
+
+    def test_open_command(self):
+        """Test opening with no chest, then with an already opened chest"""
+        cmd = Command(action="open", target="chest")
+        result = self.game_state.execute_command(cmd)
+        self.assertEqual(result['message'], "There's nothing here to open.")
+
+        room = self.dungeon.rooms["test_002"]
+        self.dungeon.room_data["test_002"] = {
+            'encounters': [{'type': 'puzzle', 'puzzle_type': 'locked_chest'}]
+        }
+        room.mark_encounter_completed("test_002_puzzle_0")
+        self.game_state.current_room = room
+
+        result = self.game_state.execute_command(cmd)
+        self.assertEqual(result['message'], "The chest is already open and empty.")
+
+    def test_open_lock_chance_uses_chest_difficulty(self):
+        """Test a thief's Open Locks chance drops with a harder lock"""
+        self.player.char_class = 'Thief'
+        self.player.thief_skills = {'open_locks': 40}
+        self.dungeon.room_data["test_001"] = {
+            'encounters': [{'type': 'puzzle', 'puzzle_type': 'locked_chest', 'difficulty': 50}]
+        }
+
+        with patch('aerthos.engine.game_state.roll_dice', return_value=100):
+            result = self.game_state.execute_command(Command(action="open", target="chest"))
+
+        self.assertIn("[Open Locks: 20% | Rolled: 100]", result['message'])
+
     def test_map_command(self):
         """Test map command"""
         cmd = Command(action="map")
@@ -294,6 +504,148 @@ class TestGameStateCommands(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIn('message', result)
 
+    def test_created_items_are_independent(self):
+        """Test items built from the same entry do not share state"""
+        self.game_state.load_game_data()
+
+        first = self.game_state._create_item_from_name('torch')
+        first.turns_remaining = 0
+        first.properties['note'] = 'used'
+        second = self.game_state._create_item_from_name('torch')
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.turns_remaining, second.burn_time_turns)
+        self.assertNotIn('note', second.properties)
+
+    def test_attack_named_target(self):
+        """Test attacking a monster by name removes only that monster"""
+        self.game_state.load_game_data()
+        self.game_state._start_combat(
+            CombatEncounter(encounter_id='test_fight', encounter_type='combat',
+                            monster_ids=['kobold', 'goblin'])
+        )
+
+        kill = {'narrative': 'Slain!', 'defender_died': True}
+        miss = {'narrative': 'Missed.', 'defender_died': False}
+        resolver = self.game_state.combat_resolver
+        with patch.object(resolver, 'attack_roll', return_value=kill), \
+                patch.object(resolver, 'attack_rolls_batch', return_value=[miss]) as counter:
+            result = self.game_state.execute_command(Command(action='attack', target='goblin'))
+
+        counter.assert_called_once_with(self.game_state.active_monsters, [self.player],
+                                        include_incapacitated=True)
+
+        self.assertTrue(result['success'])
+        self.assertEqual([m.name for m in self.game_state.active_monsters], ['Kobold'])
+        self.assertTrue(self.game_state.in_combat)
+
+    def test_attack_target_follows_replaced_monster_list(self):
+        """Test named attacks match monsters set after combat started"""
+        self.game_state.load_game_data()
+        self.game_state._start_combat(
+            CombatEncounter(encounter_id='test_fight', encounter_type='combat',
+                            monster_ids=['kobold', 'goblin'])
+        )
+        goblin = self.game_state._create_monster_from_id('goblin')
+        kobold = self.game_state._create_monster_from_id('kobold')
+        self.game_state.active_monsters = [goblin, kobold]
+
+        kill = {'narrative': 'Slain!', 'defender_died': True}
+        miss = {'narrative': 'Missed.', 'defender_died': False}
+        resolver = self.game_state.combat_resolver
+        with patch.object(resolver, 'attack_roll', return_value=kill) as attack, \
+                patch.object(resolver, 'attack_rolls_batch', return_value=[miss]):
+            self.game_state.execute_command(Command(action='attack', target='kobold'))
+
+        self.assertIs(attack.call_args[0][1], kobold)
+        self.assertEqual(self.game_state.active_monsters, [goblin])
+
+    def test_sleeping_monster_still_counter_attacks(self):
+        """Test counter-attacks come from every living monster, asleep or not"""
+        self.game_state.load_game_data()
+        self.game_state._start_combat(
+            CombatEncounter(encounter_id='test_fight', encounter_type='combat',
+                            monster_ids=['kobold', 'goblin'])
+        )
+        kobold, goblin = self.game_state.active_monsters
+        kobold.add_condition('sleeping')
+
+        miss = {'narrative': 'Missed.', 'defender_died': False}
+        with patch.object(self.game_state.combat_resolver, 'attack_roll', return_value=miss), \
+                patch.object(self.game_state.combat_resolver.dice_roller, 'roll_batch',
+                             return_value=[1, 1]):
+            result = self.game_state.execute_command(Command(action='attack', target='goblin'))
+
+        self.assertTrue(result['success'])
+        self.assertIn(f"{kobold.name} fumbles the attack!", result['message'])
+        self.assertIn(f"{goblin.name} fumbles the attack!", result['message'])
+        self.assertEqual(self.game_state.time_tracker.turns_elapsed, 1)
+
+    def test_attack_kill_splits_xp_across_party(self):
+        """Test a kill in party play splits the monster's XP between living members"""
+        ally = self.create_test_character()
+        ally.name = "Test Ally"
+        self.game_state.party = Party(members=[self.player, ally])
+        self.game_state.load_game_data()
+        self.game_state._start_combat(
+            CombatEncounter(encounter_id='test_fight', encounter_type='combat',
+                            monster_ids=['goblin'])
+        )
+        goblin = self.game_state.active_monsters[0]
+
+        kill = {'narrative': 'Slain!', 'defender_died': True}
+        with patch.object(self.game_state.combat_resolver, 'attack_roll', return_value=kill):
+            result = self.game_state.execute_command(Command(action='attack', target='goblin'))
+
+        share = goblin.xp_value // 2
+        self.assertEqual((self.player.xp, ally.xp), (share, share))
+        self.assertIn(f"Party gains {goblin.xp_value} XP! ({share} each)", result['message'])
+        self.assertFalse(self.game_state.in_combat)
+
+    def test_monster_status_labels(self):
+        """Test monster condition labels at the quarter-HP boundaries"""
+        self.game_state.load_game_data()
+        self.game_state._start_combat(
+            CombatEncounter(encounter_id='test_fight', encounter_type='combat',
+                            monster_ids=['goblin'] * 4)
+        )
+        for monster, hp in zip(self.game_state.active_monsters, (8, 6, 4, 2)):
+            monster.hp_max, monster.hp_current = 8, hp
+
+        status = self.game_state._format_monster_status()
+
+        self.assertIn("1. Goblin: 8/8 HP (Healthy)", status)
+        self.assertIn("2. Goblin: 6/8 HP (Injured)", status)
+        self.assertIn("3. Goblin: 4/8 HP (Badly Wounded)", status)
+        self.assertIn("4. Goblin: 2/8 HP (Near Death)", status)
+
+    def test_save_writes_slot_before_reporting(self):
+        """Test the save file exists by the time success is reported"""
+        with tempfile.TemporaryDirectory() as save_dir:
+            save_system = SaveSystem(save_dir)
+            with patch('aerthos.engine.game_state.SaveSystem', return_value=save_system), \
+                    patch('builtins.input', side_effect=['2', 'before the boss']), \
+                    patch('builtins.print'):
+                result = self.game_state.execute_command(Command(action="save"))
+
+            self.assertTrue(result['success'])
+            saves = save_system.list_saves()
+            self.assertEqual([(s['slot'], s['description']) for s in saves], [(2, 'before the boss')])
+
+    def test_save_reports_failed_write(self):
+        """Test a save that can't be written is reported as failed"""
+        with tempfile.TemporaryDirectory() as save_dir:
+            save_system = SaveSystem(save_dir)
+            with patch('aerthos.engine.game_state.SaveSystem', return_value=save_system), \
+                    patch.object(save_system, '_write_save', side_effect=OSError("No space left on device")), \
+                    patch('builtins.input', side_effect=['1', '']), \
+                    patch('builtins.print'):
+                result = self.game_state.execute_command(Command(action="save"))
+
+            self.assertFalse(result['success'])
+            self.assertIn("Could not save to slot 1", result['message'])
+            self.assertEqual(save_system.list_saves(), [])
+
     def test_unknown_command(self):
         """Test unknown command handling"""
         cmd = Command(action="unknown_action_xyz")
@@ -364,10 +716,14 @@ class TestGameStateSerialization(unittest.TestCase):
         """Test GameState can be serialized"""
         game_state = self.create_test_game_state()
 
-        # Check if serialize method exists
-        self.assertTrue(hasattr(game_state, 'to_dict') or
-                        hasattr(game_state, 'serialize') or
-                        hasattr(game_state, '__dict__'))
+        # GameState uses __slots__, so it is serialized through SaveSystem
+        with tempfile.TemporaryDirectory() as tmpdir:
+            save_system = SaveSystem(tmpdir)
+            save_system.save_game(game_state, slot=1)
+            save_data = save_system.load_game(slot=1)
+
+        self.assertEqual(save_data['player']['name'], 'Test Fighter')
+        self.assertEqual(save_data['current_room_id'], 'test_001')
 
     def test_game_state_json_serializable(self):
         """Test GameState data is JSON serializable"""
@@ -111,6 +111,12 @@ class TestCommandParser(unittest.TestCase):
         self.assertEqual(cmd.action, "take")
         self.assertEqual(cmd.target, "longsword")
 
+    def test_pick_up_item(self):
+        """Test 'pick' is read as take, not as picking a lock"""
+        cmd = self.parser.parse("pick dagger")
+        self.assertEqual(cmd.action, "take")
+        self.assertEqual(cmd.target, "dagger")
+
     def test_drop_item(self):
         """Test dropping items"""
         cmd = self.parser.parse("drop torch")
@@ -155,6 +161,13 @@ class TestCommandParser(unittest.TestCase):
         # Parser extracts 'carefully' as modifier (singular attribute)
         self.assertEqual(cmd.modifier, "carefully")
 
+    def test_search_cautiously(self):
+        """Test 'cautiously' is a modifier, not the search target"""
+        cmd = self.parser.parse("search cautiously")
+        self.assertEqual(cmd.action, "search")
+        self.assertIsNone(cmd.target)
+        self.assertEqual(cmd.modifier, "cautiously")
+
     def test_look(self):
         """Test look command"""
         cmd = self.parser.parse("look")
@@ -139,7 +139,7 @@ def execute_command():
             return jsonify({'success': False, 'error': 'No active game'})
 
         # Switch to the active character if party exists
-        if hasattr(game_state, 'party') and game_state.party:
+        if game_state.party:
             if 0 <= active_character_index < len(game_state.party.members):
                 game_state.player = game_state.party.members[active_character_index]
 
@@ -197,7 +197,7 @@ def get_game_state_json(game_state):
     """
 
     party_data = []
-    if hasattr(game_state, 'party'):
+    if game_state.party:
         for i, member in enumerate(game_state.party.members):
             # Get inventory items
             inventory_items = []
@@ -283,7 +283,7 @@ def get_game_state_json(game_state):
 
     # Get available spells for active character (for "cast" actions)
     available_spells = []
-    if hasattr(game_state, 'party') and len(game_state.party.members) > 0:
+    if game_state.party and len(game_state.party.members) > 0:
         # Use first living member as "active" for spell suggestions
         # (In real gameplay, frontend tracks which character is active)
         for member in game_state.party.members: